@@ -17,17 +17,17 @@ a = Analysis(
     ['floating_button_qt.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('translations.json', '.')],
     hiddenimports=[
         'sounddevice',
+        'soundfile',
         'scipy',
-        'scipy.io',
-        'scipy.io.wavfile',
         'scipy.signal',
         'numpy',
         'httpx',
         'httpx._transports',
         'httpx._transports.default',
+        'h2',
         'pyperclip',
         'PySide6',
         'PySide6.QtCore',
@@ -51,6 +51,8 @@ a = Analysis(
         # Exclude Whisper and its heavy dependencies
         'whisper',
         'openai-whisper',
+        'faster_whisper',
+        'ctranslate2',
         'torch',
         'torchvision',
         'torchaudio',
@@ -1,17 +1,75 @@
 """
 Audio recording with microphone selection using sounddevice.
 """
+import io
+import logging
+import os
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
 import tempfile
 import threading
-from scipy.io import wavfile
-from rich.console import Console
-from rich.table import Table
+import time
+from math import gcd
+from scipy import signal
 
 from config import SAMPLE_RATE, CHANNELS
 
-console = Console()
+logger = logging.getLogger(__name__)
+
+# Write buffer for the capture file
+CAPTURE_BUFFER_SIZE = 1 << 20
+# Frames per audio callback and number of ring slots between callback and writer
+RING_BLOCK_FRAMES = 1024
+RING_SLOTS = 64
+# How often the writer thread drains the ring (seconds)
+DRAIN_INTERVAL = 0.02
+# Block size used when reading the capture file back for resampling
+READ_BLOCK_FRAMES = 1 << 16
+
+
+class _BlockRing:
+    """
+    Single-producer/single-consumer ring of preallocated audio blocks.
+
+    The audio callback is the only writer of ``head`` and the drain thread
+    the only writer of ``tail``; int stores are atomic under the GIL, so no
+    lock is taken on the realtime path.
+    """
+
+    def __init__(self, slots: int, block_frames: int, channels: int, dtype):
+        self.slots = np.empty((slots, block_frames, channels), dtype=dtype)
+        # Flat byte views of each slot, so raw callback buffers are a memcpy
+        self._slot_bytes = [memoryview(slot).cast('B') for slot in self.slots]
+        self._frame_bytes = channels * self.slots.itemsize
+        self.counts = [0] * slots
+        self.size = slots
+        self.head = 0
+        self.tail = 0
+        self.dropped = 0
+
+    def push(self, buffer) -> bool:
+        """Copy a raw block of bytes into the next free slot (producer side)."""
+        head = self.head
+        if head - self.tail >= self.size:
+            self.dropped += 1
+            return False
+        idx = head % self.size
+        nbytes = len(buffer)
+        self._slot_bytes[idx][:nbytes] = buffer
+        self.counts[idx] = nbytes // self._frame_bytes
+        self.head = head + 1
+        return True
+
+    def drain(self, sink):
+        """Pass every filled slot to ``sink`` and release it (consumer side)."""
+        tail = self.tail
+        head = self.head
+        while tail != head:
+            idx = tail % self.size
+            sink(self.slots[idx, :self.counts[idx]])
+            tail += 1
+            self.tail = tail
 
 
 class AudioRecorder:
@@ -22,12 +80,28 @@ class AudioRecorder:
         self.sample_rate = sample_rate  # Puede cambiar según dispositivo
         self.channels = channels
         self.device_id = None
-        self.recording_data = []
-        self.is_recording = False
+        self._recording = threading.Event()
         self.is_paused = False
         self.stream = None
         self._lock = threading.Lock()
 
+        # Per-recording temp directory holding the capture and output files;
+        # removed as a whole by cleanup()
+        self._tmpdir = None
+
+        # Capture file, fed from the audio callback through a ring buffer
+        self._capture_path = None
+        self._capture_file = None
+        self._sf = None
+        self._ring = None
+        self._drain_thread = None
+        self._drain_stop = threading.Event()
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether a recording is in progress (lock-free read)."""
+        return self._recording.is_set()
+
     def list_devices(self) -> list:
         """List available input devices."""
         devices = sd.query_devices()
@@ -47,6 +121,11 @@ class AudioRecorder:
 
     def select_device_interactive(self) -> int:
         """Show interactive device selection and return selected device ID."""
+        # Rich is only needed by the CLI; keep it out of the GUI import path
+        from rich.console import Console
+        from rich.table import Table
+        console = Console()
+
         devices = self.list_devices()
 
         if not devices:
@@ -74,6 +153,8 @@ class AudioRecorder:
 
         console.print(table)
 
+        by_id = {d['id']: d for d in devices}
+
         # Get user selection
         while True:
             prompt = f"\n[bold]Selecciona ID del microfono[/bold] (Enter para default [{default_id}]): "
@@ -81,7 +162,7 @@ class AudioRecorder:
 
             if choice == "":
                 self.device_id = default_id
-                selected = next((d for d in devices if d['id'] == default_id), None)
+                selected = by_id.get(default_id)
                 if selected:
                     self.sample_rate = selected['sample_rate']
                     console.print(f"[green]Seleccionado: {selected['name']}[/green]")
@@ -90,9 +171,9 @@ class AudioRecorder:
 
             try:
                 device_id = int(choice)
-                if any(d['id'] == device_id for d in devices):
+                selected = by_id.get(device_id)
+                if selected:
                     self.device_id = device_id
-                    selected = next(d for d in devices if d['id'] == device_id)
                     # Usar sample rate nativo del dispositivo
                     self.sample_rate = selected['sample_rate']
                     console.print(f"[green]Seleccionado: {selected['name']}[/green]")
@@ -106,79 +187,203 @@ class AudioRecorder:
         return self.device_id
 
     def start_recording(self):
-        """Start recording audio."""
+        """Start recording audio, streaming frames to a temporary WAV file."""
         with self._lock:
             if self.is_recording:
-                console.print("[yellow]Ya esta grabando[/yellow]")
+                logger.warning("Ya esta grabando")
                 return
 
-            self.recording_data = []
-            self.is_recording = True
+            self._open_capture_file()
+            self._recording.set()
+
+        recording = self._recording
+        ring = self._ring
 
         def audio_callback(indata, frames, time, status):
             if status:
-                console.print(f"[yellow]Audio status: {status}[/yellow]")
-            if self.is_recording and not self.is_paused:
-                self.recording_data.append(indata.copy())
+                logger.warning("Audio status: %s", status)
+            if recording.is_set() and not self.is_paused:
+                ring.push(indata)
 
         try:
-            self.stream = sd.InputStream(
+            # Raw stream: the callback gets a CFFI buffer, no ndarray per block
+            self.stream = sd.RawInputStream(
                 device=self.device_id,
                 channels=self.channels,
                 samplerate=self.sample_rate,
+                blocksize=RING_BLOCK_FRAMES,
                 callback=audio_callback,
-                dtype=np.float32
+                dtype='int16'
             )
             self.stream.start()
         except Exception as e:
-            self.is_recording = False
-            console.print(f"[red]Error iniciando grabacion: {e}[/red]")
+            self._recording.clear()
+            self._discard_capture_file()
+            logger.error("Error iniciando grabacion: %s", e)
             raise
 
+    def _needs_conversion(self) -> bool:
+        """Check if the captured audio must be resampled before use."""
+        return self.sample_rate != self.target_sample_rate
+
+    def _open_capture_file(self):
+        """Open a buffered temporary mono WAV file fed by the drain thread."""
+        self.cleanup()
+        self._tmpdir = tempfile.TemporaryDirectory(
+            prefix='audio-transcribe-', ignore_cleanup_errors=True
+        )
+        self._capture_path = os.path.join(self._tmpdir.name, 'capture.wav')
+        self._capture_file = io.BufferedWriter(
+            open(self._capture_path, 'wb', buffering=0),
+            buffer_size=CAPTURE_BUFFER_SIZE
+        )
+        # Samples arrive as int16 from PortAudio; multi-channel input is
+        # downmixed to mono before it reaches the file
+        self._sf = sf.SoundFile(
+            self._capture_file, mode='w',
+            samplerate=self.sample_rate,
+            channels=1,
+            format='WAV',
+            subtype='PCM_16'
+        )
+
+        # Disk writes happen on a drain thread, never in the audio callback
+        self._ring = _BlockRing(RING_SLOTS, RING_BLOCK_FRAMES, self.channels, np.int16)
+        self._drain_stop.clear()
+        self._drain_thread = threading.Thread(target=self._drain_loop, daemon=True)
+        self._drain_thread.start()
+
+    def _drain_loop(self):
+        """Move captured blocks from the ring into the capture file."""
+        ring = self._ring
+        sink = self._sf.write
+        if self.channels > 1:
+            sink = self._downmix_sink(sink)
+        while not self._drain_stop.is_set():
+            ring.drain(sink)
+            time.sleep(DRAIN_INTERVAL)
+        ring.drain(sink)
+
+    def _downmix_sink(self, write):
+        """Wrap write so multi-channel int16 blocks are averaged to mono."""
+        channels = self.channels
+        acc = np.empty(RING_BLOCK_FRAMES, dtype=np.int32)
+        mono = np.empty(RING_BLOCK_FRAMES, dtype=np.int16)
+
+        def sink(block):
+            n = len(block)
+            # int32 accumulator so the channel sum can't overflow int16
+            np.sum(block, axis=1, dtype=np.int32, out=acc[:n])
+            np.floor_divide(acc[:n], channels, out=acc[:n])
+            mono[:n] = acc[:n]
+            write(mono[:n])
+
+        return sink
+
+    def _close_capture_file(self) -> int:
+        """Flush pending blocks, close the capture file and return frames written."""
+        if self._drain_thread is not None:
+            self._drain_stop.set()
+            self._drain_thread.join()
+            self._drain_thread = None
+        if self._ring is not None and self._ring.dropped:
+            logger.warning("Audio: %d bloques descartados", self._ring.dropped)
+        self._ring = None
+
+        frames = 0
+        if self._sf is not None:
+            frames = self._sf.frames
+            self._sf.close()
+            self._sf = None
+        if self._capture_file is not None:
+            self._capture_file.close()
+            self._capture_file = None
+        return frames
+
+    def _discard_capture_file(self):
+        """Close and delete the capture file."""
+        self._close_capture_file()
+        self._capture_path = None
+        self.cleanup()
+
+    def cleanup(self):
+        """Delete the last recording's temp directory and every file in it.
+
+        Call once the path returned by stop_recording() is no longer
+        needed; files that are still locked (Windows) are left for the OS.
+        """
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    def _read_capture(self, path: str, frames: int) -> np.ndarray:
+        """Read the mono capture file into one preallocated contiguous array."""
+        audio_data = np.empty(frames, dtype=np.float32)
+        pos = 0
+        with sf.SoundFile(path) as f:
+            while pos < frames:
+                n = f.read(READ_BLOCK_FRAMES, dtype='float32',
+                           out=audio_data[pos:pos + READ_BLOCK_FRAMES]).shape[0]
+                if n == 0:
+                    break
+                pos += n
+        return audio_data[:pos]
+
     def stop_recording(self) -> str:
         """Stop recording and return path to temporary WAV file."""
         with self._lock:
             if not self.is_recording:
                 return None
-            self.is_recording = False
+            self._recording.clear()
 
-        # Stop stream
+        # Stop stream (waits for the last callback to finish)
         if self.stream:
             self.stream.stop()
             self.stream.close()
             self.stream = None
 
-        if not self.recording_data:
-            console.print("[yellow]No se grabo audio[/yellow]")
-            return None
-
-        # Combine all chunks
-        audio_data = np.concatenate(self.recording_data, axis=0)
+        frames = self._close_capture_file()
 
-        # If stereo, take first channel
-        if len(audio_data.shape) > 1:
-            audio_data = audio_data[:, 0]
+        if not frames:
+            logger.warning("No se grabo audio")
+            self._discard_capture_file()
+            return None
 
         # Calculate duration
-        duration = len(audio_data) / self.sample_rate
-        console.print(f"[dim]Duracion: {duration:.1f}s[/dim]")
-
-        # Resample to target rate (16000Hz) if needed for Groq/Whisper
-        if self.sample_rate != self.target_sample_rate:
-            from scipy import signal
+        duration = frames / self.sample_rate
+        logger.info("Duracion: %.1fs", duration)
+
+        capture_path = self._capture_path
+        self._capture_path = None
+
+        # Already 16kHz mono PCM_16: the capture file is the output
+        if not self._needs_conversion():
+            return capture_path
+
+        audio_data = self._read_capture(capture_path, frames)
+
+        # _needs_conversion() held, so the rates differ: resample to 16000Hz.
+        # Polyphase: up/down es la razon target/source reducida por el gcd
+        # (48000 -> 16000 => up=1, down=3; 44100 -> 16000 => up=160, down=441)
+        g = gcd(self.sample_rate, self.target_sample_rate)
+        up = self.target_sample_rate // g
+        down = self.sample_rate // g
+        if g > 1:
+            audio_data = signal.resample_poly(audio_data, up, down)
+        else:
+            # Razon sin factor comun: el filtro polyphase seria enorme, usar FFT
             num_samples = int(len(audio_data) * self.target_sample_rate / self.sample_rate)
             audio_data = signal.resample(audio_data, num_samples)
-            console.print(f"[dim]Resampled: {self.sample_rate}Hz -> {self.target_sample_rate}Hz[/dim]")
-
-        # Save to temporary WAV file
-        temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        logger.info("Resampled: %dHz -> %dHz", self.sample_rate, self.target_sample_rate)
 
-        # Convert float32 [-1, 1] to int16
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+        # Clip resampler overshoot in place; libsndfile does the int16 conversion
+        np.clip(audio_data, -1.0, 1.0, out=audio_data)
 
-        wavfile.write(temp_file.name, self.target_sample_rate, audio_int16)
+        # Save next to the capture, in the recording's temp directory
+        output_path = os.path.join(self._tmpdir.name, 'recording.wav')
+        sf.write(output_path, audio_data, self.target_sample_rate, subtype='PCM_16')
 
-        return temp_file.name
+        return output_path
 
     def get_recording_status(self) -> bool:
         """Check if currently recording."""
@@ -203,7 +408,7 @@ class AudioRecorder:
     def cancel_recording(self):
         """Cancel the current recording without saving."""
         with self._lock:
-            self.is_recording = False
+            self._recording.clear()
             self.is_paused = False
 
         if self.stream:
@@ -211,7 +416,7 @@ class AudioRecorder:
             self.stream.close()
             self.stream = None
 
-        self.recording_data = []
+        self._discard_capture_file()
 
     def is_paused_status(self) -> bool:
         """Check if currently paused."""
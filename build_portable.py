@@ -4,15 +4,16 @@ Build a portable executable of Audio Transcribe using PyInstaller.
 
 Cross-platform script that:
 1. Creates a temporary build venv
-2. Installs minimal dependencies + PyInstaller
+2. Installs minimal dependencies + PyInstaller (from a local wheel cache)
 3. Runs PyInstaller with the .spec file
 4. Shows resulting file size
 5. Cleans up build venv
 
 Usage:
     python build_portable.py
-    python build_portable.py --keep-venv    # Don't delete build venv after
+    python build_portable.py --keep-venv    # Keep build venv (reused next run if requirements unchanged)
     python build_portable.py --no-clean     # Keep build artifacts (build/, dist/)
+    python build_portable.py --verbose      # Show full PyInstaller output
 
 Output:
     dist/AudioTranscribe        (Linux/macOS)
@@ -24,11 +25,26 @@ import platform
 import subprocess
 import shutil
 import argparse
+import hashlib
+from collections import deque
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PLAT = platform.system().lower()
 BUILD_VENV = SCRIPT_DIR / ".build_venv"
+WHEEL_CACHE = SCRIPT_DIR / ".build_cache"
+REQUIREMENTS = SCRIPT_DIR / "requirements.txt"
+BUILD_PACKAGES = ["pyinstaller"]
+
+# PyInstaller output shown without --verbose (plus any ERROR line)
+PYINSTALLER_MILESTONES = (
+    "Building Analysis",
+    "Building PYZ",
+    "Building PKG",
+    "Building EXE",
+    "completed successfully",
+)
+PYINSTALLER_TAIL_LINES = 40
 
 
 def supports_color():
@@ -68,8 +84,9 @@ def get_venv_pip():
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Build portable Audio Transcribe executable")
-    parser.add_argument('--keep-venv', action='store_true', help="Don't delete build venv after build")
+    parser.add_argument('--keep-venv', action='store_true', help="Don't delete build venv after build (reused if requirements unchanged)")
     parser.add_argument('--no-clean', action='store_true', help="Keep build artifacts (build/ directory)")
+    parser.add_argument('--verbose', action='store_true', help="Show full PyInstaller output")
     return parser.parse_args()
 
 
@@ -82,8 +99,46 @@ def print_banner():
     print()
 
 
-def create_build_venv():
+def requirements_hash():
+    """Hash of the build requirements, used to invalidate cached wheels/venv.
+
+    Includes the interpreter version/implementation and the platform, since
+    binary wheels are ABI-specific: a Python upgrade or a .build_cache/
+    copied from another machine must not count as current.
+    """
+    h = hashlib.sha256(REQUIREMENTS.read_bytes())
+    h.update(" ".join(BUILD_PACKAGES).encode())
+    h.update(
+        f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}"
+        f"-{PLAT}-{platform.machine()}".encode()
+    )
+    return h.hexdigest()
+
+
+def _read_stamp(path):
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _write_stamp(path, value):
+    """Write a stamp via temp file + rename, so an interrupted build never
+    leaves a stamp that vouches for an incomplete cache or venv."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        f.write(value)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def create_build_venv(reuse=False):
+    """Create the build venv. Returns True if an up-to-date venv was reused."""
     if BUILD_VENV.exists():
+        if reuse and _read_stamp(BUILD_VENV / ".req_hash") == requirements_hash():
+            print(f"{DIM}Reutilizando build venv (requirements sin cambios){NC}")
+            return True
         print(f"{DIM}Eliminando build venv anterior...{NC}")
         shutil.rmtree(BUILD_VENV)
 
@@ -93,30 +148,65 @@ def create_build_venv():
         stdout=subprocess.DEVNULL
     )
     print(f"{GREEN}Build venv creado{NC}")
+    return False
 
 
-def install_build_deps():
-    pip = get_venv_pip()
+def ensure_wheel_cache():
+    """Download/build wheels into WHEEL_CACHE when requirements changed.
 
-    print(f"{YELLOW}Instalando dependencias de build...{NC}")
+    Only this path touches the network: pip is upgraded here, before it
+    builds the wheels, and not when the cache is already current.
+    """
+    pip = get_venv_pip()
+    req_hash = requirements_hash()
+    stamp = WHEEL_CACHE / ".req_hash"
+    if _read_stamp(stamp) == req_hash:
+        print(f"{DIM}Usando wheels en cache ({WHEEL_CACHE.name}/){NC}")
+        return
 
-    # Upgrade pip
     subprocess.check_call(
         [str(pip), "install", "--upgrade", "pip", "-q"],
         stdout=subprocess.DEVNULL
     )
 
-    # Install app dependencies (without Whisper)
-    req = SCRIPT_DIR / "requirements.txt"
-    subprocess.check_call([str(pip), "install", "-r", str(req), "-q"])
+    print(f"{YELLOW}Descargando wheels a {WHEEL_CACHE.name}/...{NC}")
+    WHEEL_CACHE.mkdir(exist_ok=True)
+    subprocess.check_call([
+        str(pip), "wheel", "-q",
+        "--wheel-dir", str(WHEEL_CACHE),
+        "-r", str(REQUIREMENTS), *BUILD_PACKAGES
+    ])
+    _write_stamp(stamp, req_hash)
 
-    # Install PyInstaller
-    subprocess.check_call([str(pip), "install", "pyinstaller", "-q"])
 
+def install_build_deps():
+    pip = get_venv_pip()
+
+    print(f"{YELLOW}Instalando dependencias de build...{NC}")
+
+    ensure_wheel_cache()
+
+    # Install app dependencies (without Whisper) + PyInstaller, offline from cache
+    subprocess.check_call([
+        str(pip), "install", "-q",
+        "--no-index", "--find-links", str(WHEEL_CACHE),
+        "-r", str(REQUIREMENTS), *BUILD_PACKAGES
+    ])
+
+    _write_stamp(BUILD_VENV / ".req_hash", requirements_hash())
     print(f"{GREEN}Dependencias de build instaladas{NC}")
 
 
-def run_pyinstaller():
+def _is_summary_line(line):
+    """PyInstaller log lines worth echoing when not in verbose mode."""
+    return (
+        " ERROR:" in line
+        or line.startswith("ERROR:")
+        or any(marker in line for marker in PYINSTALLER_MILESTONES)
+    )
+
+
+def run_pyinstaller(verbose=False):
     venv_py = get_venv_python()
     spec_file = SCRIPT_DIR / "AudioTranscribe.spec"
 
@@ -124,13 +214,31 @@ def run_pyinstaller():
     print(f"{DIM}Esto puede tardar unos minutos...{NC}")
     print()
 
-    result = subprocess.run(
+    # Capture the (very chatty) log through a pipe and only echo milestones;
+    # the tail is kept to show context if the build fails
+    tail = deque(maxlen=PYINSTALLER_TAIL_LINES)
+    proc = subprocess.Popen(
         [str(venv_py), "-m", "PyInstaller", str(spec_file), "--noconfirm"],
-        cwd=str(SCRIPT_DIR)
+        cwd=str(SCRIPT_DIR),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1 << 16,
+        text=True,
+        errors="replace"
     )
-
-    if result.returncode != 0:
-        print(f"{RED}PyInstaller fallo con codigo {result.returncode}{NC}")
+    for line in proc.stdout:
+        line = line.rstrip()
+        tail.append(line)
+        if verbose or _is_summary_line(line):
+            print(f"{DIM}{line}{NC}")
+    returncode = proc.wait()
+
+    if returncode != 0:
+        if not verbose:
+            print()
+            print(f"{DIM}Ultimas lineas de PyInstaller:{NC}")
+            print("\n".join(tail))
+        print(f"{RED}PyInstaller fallo con codigo {returncode}{NC}")
         sys.exit(1)
 
     print()
@@ -188,9 +296,9 @@ def main():
         sys.exit(1)
 
     try:
-        create_build_venv()
-        install_build_deps()
-        run_pyinstaller()
+        if not create_build_venv(reuse=args.keep_venv):
+            install_build_deps()
+        run_pyinstaller(verbose=args.verbose)
         show_result()
     except subprocess.CalledProcessError as e:
         print(f"{RED}Error durante el build: {e}{NC}")
@@ -23,7 +23,12 @@ CHANNELS = 1
 
 # Whisper fallback settings
 WHISPER_MODEL = os.getenv("WHISPER_MODEL", "small")  # tiny, base, small, medium, large
-WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cuda")  # cuda or cpu
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")  # auto, cuda or cpu
+# Opt-in: load the fallback model in the background at startup (only if
+# installed). Off by default so a start doesn't load/download it unneeded
+WHISPER_WARMUP = os.getenv("WHISPER_WARMUP", "0").lower() in ("1", "true", "yes")
+# Keep Groq transcripts in ~/.cache/audio-transcribe/cache.json, keyed by audio hash
+TRANSCRIPT_CACHE = os.getenv("TRANSCRIPT_CACHE", "1").lower() in ("1", "true", "yes")
 
 # Output settings
 COPY_TO_CLIPBOARD = True
@@ -33,3 +38,5 @@ COPY_TO_CLIPBOARD = True
 BUTTON_POSITION = os.getenv("BUTTON_POSITION", "bottom-right")
 BUTTON_SIZE = int(os.getenv("BUTTON_SIZE", "50"))
 BUTTON_OPACITY = float(os.getenv("BUTTON_OPACITY", "0.9"))
+# Panel window: opaque with a rounded mask (default) or per-pixel translucent
+PANEL_TRANSLUCENT = os.getenv("PANEL_TRANSLUCENT", "0").lower() in ("1", "true", "yes")
@@ -5,26 +5,27 @@ Floating Panel GUI for Audio Transcription (Qt Version).
 Vertical panel with Record, Pause, and Cancel buttons using PySide6.
 """
 import sys
+import logging
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QMenu, QDialog, QVBoxLayout,
-    QHBoxLayout, QLabel, QListWidget, QPushButton, QListWidgetItem,
+    QHBoxLayout, QLabel, QListWidget, QPushButton,
     QComboBox, QGroupBox, QFormLayout, QMessageBox, QLineEdit
 )
 from PySide6.QtCore import (
-    Qt, QPoint, QTimer, QSize, QPropertyAnimation,
+    Qt, QEvent, QPoint, QTimer, QSize, QPropertyAnimation,
     QEasingCurve, Property, Signal, Slot, QMetaObject, Q_ARG
 )
 from PySide6.QtGui import (
-    QPainter, QColor, QBrush, QPen, QRegion,
-    QFont, QFontDatabase, QCursor, QPixmap
+    QPainter, QPainterPath, QColor, QBrush, QPen, QRegion,
+    QFont, QFontDatabase, QCursor, QPixmap, QPalette
 )
 import qtawesome as qta
 
 from transcription_controller import TranscriptionController, TranscriptionState
-from config import BUTTON_SIZE, BUTTON_POSITION, GROQ_MODEL, GROQ_API_KEY
-from settings import get_settings, update_settings, get_text, TRANSLATIONS
+from config import BUTTON_SIZE, BUTTON_POSITION, GROQ_MODEL, GROQ_API_KEY, PANEL_TRANSLUCENT
+from settings import get_settings, update_settings, get_text, get_translations
 
 
 # Button sizes
@@ -54,6 +55,15 @@ COLORS = {
 }
 
 
+# Spinner rotation step in degrees (one pre-rendered frame per step)
+SPIN_STEP = 10
+SPIN_DURATION_MS = 1080  # One full turn
+# Pulse: 1.0 -> max -> min -> 1.0 per cycle
+PULSE_DURATION_MS = 1330
+PULSE_MIN_SCALE = 0.92
+PULSE_MAX_SCALE = 1.08
+
+
 SIZE_PRESETS = {
     "mini": 36,
     "small": 44,
@@ -63,11 +73,83 @@ SIZE_PRESETS = {
 }
 
 
+# Icons used by the panel buttons (closed set, pre-rendered per size)
+MAIN_ICON_NAMES = (
+    'mdi.microphone', 'mdi.stop', 'mdi.pause', 'mdi.play', 'mdi.loading',
+    'mdi.close', 'mdi.check-circle', 'mdi.alert-circle',
+)
+SMALL_ICON_NAMES = ('mdi.help', 'mdi.cog', 'mdi.exit-to-app')
+SMALL_ICON_SIZE = 12
+
+_QICON_CACHE = {}
+_ICON_CACHE = {}
+
+
+def _qicon(name: str, color: str = 'white'):
+    """Return the qtawesome QIcon for name/color, built once."""
+    key = (name, color)
+    icon = _QICON_CACHE.get(key)
+    if icon is None:
+        icon = qta.icon(name, color=color)
+        _QICON_CACHE[key] = icon
+    return icon
+
+
+def _icon_pixmap(name: str, size: int, color: str = 'white') -> QPixmap:
+    """Return the icon rendered at size x size (cached)."""
+    key = (name, color, size)
+    pixmap = _ICON_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _qicon(name, color).pixmap(QSize(size, size))
+        _ICON_CACHE[key] = pixmap
+    return pixmap
+
+
+def _main_icon_size(btn_size: int) -> int:
+    """Base icon pixmap size for a main button of btn_size."""
+    return int(btn_size * 0.48)
+
+
+def _build_icon_cache(btn_size: int):
+    """Pre-render every panel icon for the given main button size."""
+    main_size = _main_icon_size(btn_size)
+    for name in MAIN_ICON_NAMES:
+        _icon_pixmap(name, main_size)
+    for name in SMALL_ICON_NAMES:
+        _icon_pixmap(name, SMALL_ICON_SIZE)
+
+
+# Icons resized for drawing, keyed by (name, button size, drawn size)
+_SCALED_ICON_CACHE = {}
+
+_CIRCLE_STYLES = {}
+
+
+def _circle_style(color: QColor):
+    """Fill brush and border pen for a button circle of the given color (cached)."""
+    key = color.rgba()
+    style = _CIRCLE_STYLES.get(key)
+    if style is None:
+        style = (QBrush(color), QPen(color.darker(120), 1))
+        _CIRCLE_STYLES[key] = style
+    return style
+
+
+def _circle_look(color: QColor):
+    """(color, brush, pen) ready for CircularButton.paintEvent."""
+    return (color, *_circle_style(color))
+
+
 class CircularButton(QWidget):
     """A single circular button."""
 
     clicked = Signal()
 
+    # Rendered glow + circle keyed by (size, color rgba, scale), shared by all buttons
+    _DISC_CACHE = {}
+    # Icon (size, offset) keyed by (button size, scale)
+    _GEOMETRY_CACHE = {}
+
     def __init__(self, icon_name: str, color: QColor, parent=None, size=BTN_SIZE):
         super().__init__(parent)
         self._btn_size = size
@@ -77,81 +159,249 @@ class CircularButton(QWidget):
         self._icon_name = icon_name
         self._color = color
         self._hover_color = color.lighter(120)
+        self._look = _circle_look(self._color)
+        self._hover_look = _circle_look(self._hover_color)
+        self._disabled_look = _circle_look(COLORS['disabled'])
         self._is_hovered = False
         self._is_enabled = True
         self._scale = 1.0
         self._spin_angle = 0
         self._is_spinning = False
-        self._is_pulsing = False
-        self._pulse_direction = 1
+        self._suspended = False
 
         # Pre-load icon
         self._update_icon()
 
-        # Animation timer
-        self._anim_timer = QTimer(self)
-        self._anim_timer.timeout.connect(self._anim_tick)
+        # Animations. Every QPropertyAnimation is ticked by Qt's single unified
+        # animation timer (~60 Hz), so buttons animating at the same time are
+        # updated in the same tick and repainted in one pass; no per-button
+        # QTimer. Setters only repaint when the snapped value changes.
+        # The per-frame Python work is one rounding and a comparison; don't
+        # JIT it (e.g. Numba): dispatch overhead would exceed the work itself.
+        self._pulse_anim = QPropertyAnimation(self, b"pulse_scale", self)
+        self._pulse_anim.setDuration(PULSE_DURATION_MS)
+        self._pulse_anim.setKeyValueAt(0.0, 1.0)
+        self._pulse_anim.setKeyValueAt(0.25, PULSE_MAX_SCALE)
+        self._pulse_anim.setKeyValueAt(0.75, PULSE_MIN_SCALE)
+        self._pulse_anim.setKeyValueAt(1.0, 1.0)
+        self._pulse_anim.setEasingCurve(QEasingCurve.Linear)
+        self._pulse_anim.setLoopCount(-1)
+
+        self._spin_anim = QPropertyAnimation(self, b"spin_angle", self)
+        self._spin_anim.setDuration(SPIN_DURATION_MS)
+        self._spin_anim.setStartValue(0)
+        self._spin_anim.setEndValue(360)
+        self._spin_anim.setEasingCurve(QEasingCurve.Linear)
+        self._spin_anim.setLoopCount(-1)
+
+    def _get_pulse_scale(self) -> float:
+        return self._scale
+
+    def _set_pulse_scale(self, value: float):
+        # Quantize so near-identical frames don't trigger a repaint
+        value = round(value, 2)
+        if value != self._scale:
+            self._scale = value
+            self.update()
+
+    pulse_scale = Property(float, _get_pulse_scale, _set_pulse_scale)
+
+    def _get_spin_angle(self) -> int:
+        return self._spin_angle
+
+    def _set_spin_angle(self, value: int):
+        # Snap to the pre-rendered spinner frames
+        value = (int(value) // SPIN_STEP * SPIN_STEP) % 360
+        if value != self._spin_angle:
+            self._spin_angle = value
+            # Only the icon turns; the glow and disc around it are unchanged
+            icon_size, offset = self._icon_geometry()
+            self.update(offset, offset, icon_size, icon_size)
+
+    spin_angle = Property(int, _get_spin_angle, _set_spin_angle)
 
     def _update_icon(self):
-        """Update the icon pixmap."""
-        s = int(self._btn_size * 0.48)
-        icon_size = QSize(s, s)
-        self._icon_pixmap = qta.icon(self._icon_name, color='white').pixmap(icon_size)
+        """Update the icon pixmap and drop pixmaps derived from the old one."""
+        self._icon_pixmap = _icon_pixmap(self._icon_name, _main_icon_size(self._btn_size))
+        self._spin_frames = None
+
+    def _icon_draw_size(self, scale: float) -> int:
+        """Pixel size of the drawn icon at the given pulse scale."""
+        return int(self._btn_size * 0.4 * scale)
+
+    def _icon_geometry(self):
+        """(icon size, top-left offset) for the current scale, precomputed."""
+        key = (self._btn_size, self._scale)
+        geometry = CircularButton._GEOMETRY_CACHE.get(key)
+        if geometry is None:
+            icon_size = self._icon_draw_size(self._scale)
+            offset = int(self._btn_size / 2 - icon_size / 2)
+            geometry = (icon_size, offset)
+            CircularButton._GEOMETRY_CACHE[key] = geometry
+        return geometry
+
+    def _scaled_icon(self, icon_size: int) -> QPixmap:
+        """Return the icon scaled to icon_size (shared cache, survives icon changes)."""
+        key = (self._icon_name, self._btn_size, icon_size)
+        pixmap = _SCALED_ICON_CACHE.get(key)
+        if pixmap is None:
+            pixmap = self._icon_pixmap.scaled(
+                icon_size, icon_size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            _SCALED_ICON_CACHE[key] = pixmap
+        return pixmap
+
+    def _warm_pulse_icons(self):
+        """Scale the icon for every size the pulse can reach, before it starts."""
+        low = self._icon_draw_size(PULSE_MIN_SCALE)
+        high = self._icon_draw_size(PULSE_MAX_SCALE)
+        for icon_size in range(low, high + 1):
+            self._scaled_icon(icon_size)
+
+    def _disc_pixmap(self, color: QColor, brush: QBrush, pen: QPen) -> QPixmap:
+        """Return glow + circle for color at the current scale (shared cache)."""
+        key = (self._btn_size, color.rgba(), self._scale)
+        pixmap = CircularButton._DISC_CACHE.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        size = self._btn_size
+        center = size / 2
+        radius = (size / 2 - 2) * self._scale
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+
+        # Glow: fill only the rings outside the opaque disc (the hole is 1px
+        # smaller than the disc so its antialiased edge still blends on glow)
+        hole_radius = radius - 1
+        p.setPen(Qt.NoPen)
+        for i in range(2):
+            glow_radius = radius + (2 - i) * 2
+            glow_color = QColor(color)
+            glow_color.setAlpha(25 + i * 15)
+            ring = QPainterPath()
+            ring.addEllipse(
+                int(center - glow_radius),
+                int(center - glow_radius),
+                int(glow_radius * 2),
+                int(glow_radius * 2)
+            )
+            ring.addEllipse(
+                int(center - hole_radius),
+                int(center - hole_radius),
+                int(hole_radius * 2),
+                int(hole_radius * 2)
+            )
+            p.fillPath(ring, QBrush(glow_color))
+
+        # Circle
+        p.setBrush(brush)
+        p.setPen(pen)
+        p.drawEllipse(
+            int(center - radius),
+            int(center - radius),
+            int(radius * 2),
+            int(radius * 2)
+        )
+        p.end()
+
+        CircularButton._DISC_CACHE[key] = pixmap
+        return pixmap
+
+    def _build_spin_frames(self, icon_size: int):
+        """Pre-render one rotated copy of the icon per SPIN_STEP degrees."""
+        base = self._scaled_icon(icon_size)
+        c = icon_size / 2
+        frames = []
+        for angle in range(0, 360, SPIN_STEP):
+            frame = QPixmap(icon_size, icon_size)
+            frame.fill(Qt.transparent)
+            p = QPainter(frame)
+            p.setRenderHint(QPainter.SmoothPixmapTransform)
+            p.translate(c, c)
+            p.rotate(angle)
+            p.translate(-c, -c)
+            p.drawPixmap(0, 0, base)
+            p.end()
+            frames.append(frame)
+        self._spin_frames = frames
 
     def set_icon(self, icon_name: str):
         """Change the button icon."""
+        if icon_name == self._icon_name:
+            return
         self._icon_name = icon_name
         self._update_icon()
         self.update()
 
     def set_color(self, color: QColor, hover_color: QColor = None):
         """Change button colors."""
+        hover_color = hover_color or color.lighter(120)
+        if color.rgba() == self._color.rgba() and hover_color.rgba() == self._hover_color.rgba():
+            return
         self._color = color
-        self._hover_color = hover_color or color.lighter(120)
+        self._hover_color = hover_color
+        self._look = _circle_look(self._color)
+        self._hover_look = _circle_look(self._hover_color)
         self.update()
 
     def set_enabled(self, enabled: bool):
         """Enable or disable the button."""
+        if enabled == self._is_enabled:
+            return
         self._is_enabled = enabled
         self.setCursor(Qt.PointingHandCursor if enabled else Qt.ForbiddenCursor)
         self.update()
 
     def start_pulse(self):
         """Start pulse animation."""
-        self._is_pulsing = True
+        self._spin_anim.stop()
         self._is_spinning = False
-        self._scale = 1.0
-        self._pulse_direction = 1
-        if not self._anim_timer.isActive():
-            self._anim_timer.start(50)
+        self._spin_angle = 0
+        if self._pulse_anim.state() != QPropertyAnimation.Running:
+            self._scale = 1.0
+            self._warm_pulse_icons()
+            self._pulse_anim.start()
+            if self._suspended:
+                self._pulse_anim.pause()
 
     def start_spin(self):
         """Start spin animation."""
+        self._pulse_anim.stop()
+        self._scale = 1.0
         self._is_spinning = True
-        self._is_pulsing = False
-        self._spin_angle = 0
-        if not self._anim_timer.isActive():
-            self._anim_timer.start(30)
+        if self._spin_anim.state() != QPropertyAnimation.Running:
+            self._spin_angle = 0
+            self._spin_anim.start()
+            if self._suspended:
+                self._spin_anim.pause()
 
     def stop_animation(self):
         """Stop all animations."""
-        self._is_pulsing = False
+        self._pulse_anim.stop()
+        self._spin_anim.stop()
         self._is_spinning = False
         self._scale = 1.0
-        self._anim_timer.stop()
+        self._spin_angle = 0
         self.update()
 
-    def _anim_tick(self):
-        """Animation tick."""
-        if self._is_pulsing:
-            self._scale += 0.012 * self._pulse_direction
-            if self._scale >= 1.08:
-                self._pulse_direction = -1
-            elif self._scale <= 0.92:
-                self._pulse_direction = 1
-        elif self._is_spinning:
-            self._spin_angle = (self._spin_angle + 10) % 360
-        self.update()
+    def suspend_animations(self):
+        """Pause running animations while the panel can't be seen."""
+        self._suspended = True
+        for anim in (self._pulse_anim, self._spin_anim):
+            if anim.state() == QPropertyAnimation.Running:
+                anim.pause()
+
+    def resume_animations(self):
+        """Resume animations paused by suspend_animations()."""
+        self._suspended = False
+        for anim in (self._pulse_anim, self._spin_anim):
+            if anim.state() == QPropertyAnimation.Paused:
+                anim.resume()
 
     def set_btn_size(self, size: int):
         """Update button size dynamically."""
@@ -161,79 +411,47 @@ class CircularButton(QWidget):
         self.update()
 
     def paintEvent(self, event):
-        """Draw the circular button."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        """Draw the circular button from cached pixmaps.
 
-        center = self._btn_size / 2
-        radius = (self._btn_size / 2 - 2) * self._scale
+        The painter is clipped to the event region, so a spin frame
+        (icon rect only) just re-blits that part of the disc.
+        """
+        painter = QPainter(self)
 
-        # Determine color
+        # Pick the precomputed color/brush/pen for the current state
         if not self._is_enabled:
-            color = COLORS['disabled']
+            color, brush, pen = self._disabled_look
         elif self._is_hovered:
-            color = self._hover_color
+            color, brush, pen = self._hover_look
         else:
-            color = self._color
+            color, brush, pen = self._look
 
-        # Draw glow
-        for i in range(2):
-            glow_radius = radius + (2 - i) * 2
-            glow_color = QColor(color)
-            glow_color.setAlpha(25 + i * 15)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(glow_color))
-            painter.drawEllipse(
-                int(center - glow_radius),
-                int(center - glow_radius),
-                int(glow_radius * 2),
-                int(glow_radius * 2)
-            )
-
-        # Draw circle
-        painter.setBrush(QBrush(color))
-        painter.setPen(QPen(color.darker(120), 1))
-        painter.drawEllipse(
-            int(center - radius),
-            int(center - radius),
-            int(radius * 2),
-            int(radius * 2)
-        )
+        # Draw glow + circle (pre-rendered per size/color/scale)
+        painter.drawPixmap(0, 0, self._disc_pixmap(color, brush, pen))
 
         # Draw icon
-        icon_size = int(self._btn_size * 0.4 * self._scale)
-        scaled_pixmap = self._icon_pixmap.scaled(
-            icon_size, icon_size,
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        icon_size, offset = self._icon_geometry()
 
         if self._is_spinning:
-            painter.save()
-            painter.translate(center, center)
-            painter.rotate(self._spin_angle)
-            painter.drawPixmap(
-                int(-icon_size / 2),
-                int(-icon_size / 2),
-                scaled_pixmap
-            )
-            painter.restore()
+            if self._spin_frames is None:
+                self._build_spin_frames(icon_size)
+            pixmap = self._spin_frames[self._spin_angle // SPIN_STEP]
         else:
-            painter.drawPixmap(
-                int(center - icon_size / 2),
-                int(center - icon_size / 2),
-                scaled_pixmap
-            )
+            pixmap = self._scaled_icon(icon_size)
+
+        painter.drawPixmap(offset, offset, pixmap)
 
         painter.end()
 
     def enterEvent(self, event):
-        self._is_hovered = True
-        self.update()
+        if not self._is_hovered:
+            self._is_hovered = True
+            self.update()
 
     def leaveEvent(self, event):
-        self._is_hovered = False
-        self.update()
+        if self._is_hovered:
+            self._is_hovered = False
+            self.update()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton and self._is_enabled:
@@ -258,51 +476,58 @@ class SmallButton(QWidget):
         self.setToolTip(tooltip)
 
         self._icon_name = icon_name
-        self._color = COLORS['utility']
-        self._hover_color = COLORS['utility_hover']
         self._is_hovered = False
 
-        # Pre-load icon
-        icon_size = QSize(12, 12)
-        self._icon_pixmap = qta.icon(icon_name, color='white').pixmap(icon_size)
-
-    def paintEvent(self, event):
-        """Draw the small button."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Pre-render both looks once; painting is a single blit
+        icon = _icon_pixmap(icon_name, SMALL_ICON_SIZE)
+        self._pixmap = self._render(COLORS['utility'], icon)
+        self._hover_pixmap = self._render(COLORS['utility_hover'], icon)
 
+    @staticmethod
+    def _render(color: QColor, icon: QPixmap) -> QPixmap:
+        """Render the circle + icon for color into a pixmap."""
         center = SMALL_BTN_SIZE / 2
         radius = SMALL_BTN_SIZE / 2 - 1
 
-        color = self._hover_color if self._is_hovered else self._color
+        pixmap = QPixmap(SMALL_BTN_SIZE, SMALL_BTN_SIZE)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
 
-        # Draw circle
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(color))
-        painter.drawEllipse(
+        # Circle
+        p.setPen(Qt.NoPen)
+        p.setBrush(QBrush(color))
+        p.drawEllipse(
             int(center - radius),
             int(center - radius),
             int(radius * 2),
             int(radius * 2)
         )
 
-        # Draw icon
-        icon_size = 12
-        painter.drawPixmap(
-            int(center - icon_size / 2),
-            int(center - icon_size / 2),
-            self._icon_pixmap
+        # Icon
+        p.drawPixmap(
+            int(center - SMALL_ICON_SIZE / 2),
+            int(center - SMALL_ICON_SIZE / 2),
+            icon
         )
+        p.end()
+        return pixmap
 
+    def paintEvent(self, event):
+        """Draw the small button."""
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._hover_pixmap if self._is_hovered else self._pixmap)
         painter.end()
 
     def enterEvent(self, event):
-        self._is_hovered = True
-        self.update()
+        if not self._is_hovered:
+            self._is_hovered = True
+            self.update()
 
     def leaveEvent(self, event):
-        self._is_hovered = False
-        self.update()
+        if self._is_hovered:
+            self._is_hovered = False
+            self.update()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -323,7 +548,7 @@ class FloatingPanel(QWidget):
     transcription_completed = Signal(str)
     transcription_errored = Signal(str)
 
-    def __init__(self):
+    def __init__(self, settings=None):
         super().__init__()
 
         # Window flags: frameless, always on top, tool window
@@ -332,25 +557,48 @@ class FloatingPanel(QWidget):
             Qt.WindowStaysOnTopHint |
             Qt.Tool
         )
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        # Opaque window clipped to the rounded rect by a mask (see resizeEvent),
+        # unless per-pixel translucency is requested
+        if PANEL_TRANSLUCENT:
+            self.setAttribute(Qt.WA_TranslucentBackground)
 
         # Read layout settings
-        settings = get_settings()
+        # Live read-only view; reflects later update_settings() calls
+        self._settings = settings = settings if settings is not None else get_settings()
         size_key = settings.get("button_size", "normal")
         self._btn_size = SIZE_PRESETS.get(size_key, SIZE_PRESETS["normal"])
         self._orientation = settings.get("orientation", "vertical")
 
+        # Active-language translation table
+        self._tr = get_translations(settings.get("language", "es"))
+
         # State
         self._state = TranscriptionState.IDLE
+        # Latest state received but not yet applied (see _handle_state_change)
+        self._pending_state: Optional[TranscriptionState] = None
+
+        # Primary screen geometry, cached on first positioning, and the
+        # screen whose geometryChanged keeps it current
+        self._screen_geometry = None
+        self._watched_screen = None
+
+        # Cached background pixmap
+        self._bg_pixmap: Optional[QPixmap] = None
+
+        # Dialogs are built on first use and reused while the language holds
+        self._help_dialog: Optional["HelpDialog"] = None
+        self._settings_dialog: Optional["SettingsDialog"] = None
 
         # Drag support
-        self._drag_position: Optional[QPoint] = None
+        self._drag_start_global: Optional[QPoint] = None
+        self._drag_start_pos: Optional[QPoint] = None
         self._is_dragging = False
 
         # Controller
         self.controller: Optional[TranscriptionController] = None
 
-        # Create buttons (without positioning)
+        # Render all icons once, then create buttons (without positioning)
+        _build_icon_cache(self._btn_size)
         self._create_buttons()
 
         # Layout and position
@@ -381,19 +629,16 @@ class FloatingPanel(QWidget):
         self.btn_cancel.clicked.connect(self._on_cancel_click)
         self.btn_cancel.set_enabled(False)
 
-        settings = get_settings()
-        lang = settings.get("language", "es")
-
         # Help button
-        self.btn_help = SmallButton('mdi.help', get_text("tooltip_help", lang), self)
+        self.btn_help = SmallButton('mdi.help', self._tr["tooltip_help"], self)
         self.btn_help.clicked.connect(self._show_help)
 
         # Settings button
-        self.btn_settings = SmallButton('mdi.cog', get_text("tooltip_settings", lang), self)
+        self.btn_settings = SmallButton('mdi.cog', self._tr["tooltip_settings"], self)
         self.btn_settings.clicked.connect(self._show_device_selector)
 
         # Exit button
-        self.btn_exit = SmallButton('mdi.exit-to-app', get_text("tooltip_exit", lang), self)
+        self.btn_exit = SmallButton('mdi.exit-to-app', self._tr["tooltip_exit"], self)
         self.btn_exit.clicked.connect(QApplication.quit)
 
     def _layout_panel(self):
@@ -445,12 +690,13 @@ class FloatingPanel(QWidget):
 
     def _apply_layout_settings(self):
         """Apply new layout settings (called after settings change)."""
-        settings = get_settings()
+        settings = self._settings
         size_key = settings.get("button_size", "normal")
         self._btn_size = SIZE_PRESETS.get(size_key, SIZE_PRESETS["normal"])
         self._orientation = settings.get("orientation", "vertical")
 
         # Update button sizes
+        _build_icon_cache(self._btn_size)
         self.btn_record.set_btn_size(self._btn_size)
         self.btn_pause.set_btn_size(self._btn_size)
         self.btn_cancel.set_btn_size(self._btn_size)
@@ -461,33 +707,49 @@ class FloatingPanel(QWidget):
 
     def _update_tooltips(self):
         """Update button tooltips with current language."""
-        settings = get_settings()
-        lang = settings.get("language", "es")
-        self.btn_help.setToolTip(get_text("tooltip_help", lang))
-        self.btn_settings.setToolTip(get_text("tooltip_settings", lang))
-        self.btn_exit.setToolTip(get_text("tooltip_exit", lang))
+        self.btn_help.setToolTip(self._tr["tooltip_help"])
+        self.btn_settings.setToolTip(self._tr["tooltip_settings"])
+        self.btn_exit.setToolTip(self._tr["tooltip_exit"])
+
+    def _watch_screen(self, screen):
+        """Cache screen's geometry and keep the cache current.
+
+        Only one screen is followed: the previous one (after a primary
+        screen change) is disconnected so it can't overwrite the cache.
+        """
+        if self._watched_screen is not None:
+            try:
+                self._watched_screen.geometryChanged.disconnect(self._on_screen_geometry_changed)
+            except (RuntimeError, TypeError):
+                pass  # Screen already removed
+        self._watched_screen = screen
+        self._screen_geometry = screen.geometry()
+        screen.geometryChanged.connect(self._on_screen_geometry_changed)
+
+    def _on_screen_geometry_changed(self, geometry):
+        self._screen_geometry = geometry
 
     def _position_window(self):
         """Position window based on config."""
-        screen = QApplication.primaryScreen().geometry()
+        if self._screen_geometry is None:
+            self._watch_screen(QApplication.primaryScreen())
+            QApplication.instance().primaryScreenChanged.connect(self._watch_screen)
+        screen = self._screen_geometry
         margin = 30
 
-        positions = {
-            'top-left': QPoint(margin, margin),
-            'top-right': QPoint(screen.width() - self.width() - margin, margin),
-            'bottom-left': QPoint(margin, screen.height() - self.height() - margin - 50),
-            'bottom-right': QPoint(
-                screen.width() - self.width() - margin,
-                screen.height() - self.height() - margin - 50
-            ),
-            'center': QPoint(
-                (screen.width() - self.width()) // 2,
-                (screen.height() - self.height()) // 2
-            ),
-        }
-
-        pos = positions.get(BUTTON_POSITION, positions['bottom-right'])
-        self.move(pos)
+        position = BUTTON_POSITION
+        if position not in ('top-left', 'top-right', 'bottom-left', 'bottom-right', 'center'):
+            position = 'bottom-right'
+
+        if position == 'center':
+            x = (screen.width() - self.width()) // 2
+            y = (screen.height() - self.height()) // 2
+        else:
+            vertical, horizontal = position.split('-')
+            x = margin if horizontal == 'left' else screen.width() - self.width() - margin
+            y = margin if vertical == 'top' else screen.height() - self.height() - margin - 50
+
+        self.move(x, y)
 
     def _create_context_menu(self):
         """Create right-click menu."""
@@ -496,16 +758,42 @@ class FloatingPanel(QWidget):
         self._menu.addSeparator()
         self._menu.addAction("Salir", QApplication.quit)
 
+    def _rounded_path(self) -> QPainterPath:
+        """Rounded-rect outline of the panel."""
+        path = QPainterPath()
+        path.addRoundedRect(self.rect(), 12, 12)
+        return path
+
+    def _render_background(self) -> QPixmap:
+        """Render the rounded panel background for the current size."""
+        pixmap = QPixmap(self.size())
+        if not PANEL_TRANSLUCENT:
+            # The window mask cuts the corners; fill the full rect opaquely
+            color = QColor(COLORS['panel_bg'])
+            color.setAlpha(255)
+            pixmap.fill(color)
+            return pixmap
+
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        p.setBrush(QBrush(COLORS['panel_bg']))
+        p.drawRoundedRect(pixmap.rect(), 12, 12)
+        p.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not PANEL_TRANSLUCENT:
+            self.setMask(QRegion(self._rounded_path().toFillPolygon().toPolygon()))
+
     def paintEvent(self, event):
-        """Draw the panel background."""
+        """Draw the panel background (cached until the panel is resized)."""
+        if self._bg_pixmap is None or self._bg_pixmap.size() != self.size():
+            self._bg_pixmap = self._render_background()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Draw rounded rectangle background
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(COLORS['panel_bg']))
-        painter.drawRoundedRect(self.rect(), 12, 12)
-
+        painter.drawPixmap(0, 0, self._bg_pixmap)
         painter.end()
 
     # === Button Click Handlers ===
@@ -532,9 +820,12 @@ class FloatingPanel(QWidget):
 
     def _show_help(self):
         """Show help dialog."""
-        settings = get_settings()
-        dialog = HelpDialog(settings.get("language", "es"), self)
-        dialog.exec()
+        lang = self._settings.get("language", "es")
+        if self._help_dialog is None or self._help_dialog.lang != lang:
+            if self._help_dialog is not None:
+                self._help_dialog.deleteLater()
+            self._help_dialog = HelpDialog(lang, self)
+        self._help_dialog.exec()
 
     # === State Updates ===
 
@@ -617,23 +908,26 @@ class FloatingPanel(QWidget):
     def mousePressEvent(self, event):
         """Handle mouse press for dragging."""
         if event.button() == Qt.LeftButton:
-            self._drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            # Remember where the drag started; moves are offsets from here
+            self._drag_start_global = event.globalPosition().toPoint()
+            self._drag_start_pos = self.pos()
             self._is_dragging = False
             event.accept()
 
     def mouseMoveEvent(self, event):
         """Handle mouse drag."""
-        if event.buttons() & Qt.LeftButton and self._drag_position:
-            delta = event.globalPosition().toPoint() - self._drag_position - self.pos()
-            if delta.manhattanLength() > 5:
+        if self._drag_start_global is not None and event.buttons() & Qt.LeftButton:
+            delta = event.globalPosition().toPoint() - self._drag_start_global
+            if not self._is_dragging and delta.manhattanLength() > 5:
                 self._is_dragging = True
             if self._is_dragging:
-                self.move(event.globalPosition().toPoint() - self._drag_position)
+                self.move(self._drag_start_pos + delta)
             event.accept()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release."""
-        self._drag_position = None
+        self._drag_start_global = None
+        self._drag_start_pos = None
         self._is_dragging = False
         event.accept()
 
@@ -641,6 +935,29 @@ class FloatingPanel(QWidget):
         """Show context menu on right-click."""
         self._menu.exec(event.globalPos())
 
+    # === Animation suspension while not visible ===
+
+    def _set_animations_suspended(self, suspended: bool):
+        """Pause/resume the main button animations."""
+        for btn in (self.btn_record, self.btn_pause, self.btn_cancel):
+            if suspended:
+                btn.suspend_animations()
+            else:
+                btn.resume_animations()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._set_animations_suspended(self.isMinimized())
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._set_animations_suspended(True)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            self._set_animations_suspended(self.isMinimized() or not self.isVisible())
+        super().changeEvent(event)
+
     # === Controller Callbacks ===
 
     def _on_state_change(self, state: TranscriptionState):
@@ -659,12 +976,27 @@ class FloatingPanel(QWidget):
 
     @Slot(object)
     def _handle_state_change(self, state: TranscriptionState):
-        """Handle state change in main thread."""
-        self._update_buttons_for_state(state)
+        """Handle state change in main thread.
+
+        Changes queued in the same event-loop pass are coalesced: only the
+        last one is applied, so a burst costs one repaint.
+        """
+        scheduled = self._pending_state is not None
+        self._pending_state = state
+        if not scheduled:
+            QTimer.singleShot(0, self._flush_pending_state)
+
+    def _flush_pending_state(self):
+        """Apply the last state received by _handle_state_change."""
+        state, self._pending_state = self._pending_state, None
+        if state is not None:
+            self._update_buttons_for_state(state)
 
     @Slot(str)
     def _handle_transcription_complete(self, text: str):
         """Handle successful transcription in main thread."""
+        # The IDLE that preceded this would overwrite the check mark
+        self._pending_state = None
         # Show success briefly
         self.btn_record.set_icon('mdi.check-circle')
         self.btn_record.set_color(COLORS['idle'], COLORS['idle_hover'])
@@ -674,6 +1006,7 @@ class FloatingPanel(QWidget):
     @Slot(str)
     def _handle_transcription_error(self, error: str):
         """Handle error in main thread."""
+        self._pending_state = None
         self._update_buttons_for_state(TranscriptionState.ERROR)
         QTimer.singleShot(2000, lambda: self._update_buttons_for_state(TranscriptionState.IDLE))
 
@@ -688,12 +1021,20 @@ class FloatingPanel(QWidget):
         if not devices:
             return
 
-        settings = get_settings()
+        settings = self._settings
         current_device = self.controller.get_selected_device()
         current_device_id = current_device['id'] if current_device else None
         current_language = settings.get("language", "es")
 
-        dialog = SettingsDialog(devices, current_device_id, current_language, self)
+        dialog = self._settings_dialog
+        if dialog is None or dialog.lang != current_language:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = SettingsDialog(devices, current_device_id, current_language, self)
+            self._settings_dialog = dialog
+        else:
+            dialog.refresh(devices, current_device_id)
+
         if dialog.exec() == QDialog.Accepted:
             changed = False
             layout_changed = False
@@ -706,6 +1047,7 @@ class FloatingPanel(QWidget):
             if dialog.selected_language and dialog.selected_language != current_language:
                 self.controller.set_language(dialog.selected_language)
                 update_settings(language=dialog.selected_language)
+                self._tr = get_translations(dialog.selected_language)
                 self._update_tooltips()
                 changed = True
 
@@ -748,10 +1090,10 @@ class FloatingPanel(QWidget):
             return False
 
         # Check if we have a saved device that is still available
-        settings = get_settings()
+        settings = self._settings
         saved_device_id = settings.get("device_id")
         if saved_device_id is not None:
-            available_ids = [d['id'] for d in devices]
+            available_ids = {d['id'] for d in devices}
             if saved_device_id in available_ids:
                 self.controller.select_device(saved_device_id)
                 return True
@@ -796,7 +1138,7 @@ class HelpDialog(QDialog):
         lang_name = "Español" if lang == "es" else "English"
         lang_label = QLabel(f"{t('help_current_lang')}: <b>{lang_name}</b>")
         lang_label.setAlignment(Qt.AlignCenter)
-        lang_label.setStyleSheet("color: #4CAF50;")
+        lang_label.setObjectName("helpLangLabel")
         layout.addWidget(lang_label)
 
         # Help content
@@ -824,17 +1166,7 @@ class HelpDialog(QDialog):
         # Close button
         close_btn = QPushButton(t("help_ok"))
         close_btn.setFixedWidth(80)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        close_btn.setObjectName("helpOkBtn")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn, alignment=Qt.AlignCenter)
 
@@ -858,14 +1190,6 @@ class SettingsDialog(QDialog):
         self.setFixedSize(360, 560)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
 
-        self.selected_device_id = current_device_id
-        self.selected_language = current_language
-        self.selected_api_key = None
-        self.selected_button_size = None
-        self.selected_orientation = None
-
-        settings = get_settings()
-
         layout = QVBoxLayout(self)
         layout.setSpacing(12)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -877,17 +1201,14 @@ class SettingsDialog(QDialog):
         self.api_key_input = QLineEdit()
         self.api_key_input.setEchoMode(QLineEdit.Password)
         self.api_key_input.setPlaceholderText(t("settings_api_key_hint"))
-        self.api_key_input.setStyleSheet("QLineEdit { padding: 6px; }")
-        current_key = settings.get("groq_api_key", "") or GROQ_API_KEY
-        if current_key:
-            self.api_key_input.setText(current_key)
+        self.api_key_input.setObjectName("settingsKeyInput")
         api_layout.addWidget(self.api_key_input)
 
         # Toggle visibility button
         self.show_key_btn = QPushButton("👁")
         self.show_key_btn.setFixedWidth(32)
         self.show_key_btn.setCheckable(True)
-        self.show_key_btn.setStyleSheet("QPushButton { border: none; font-size: 14px; }")
+        self.show_key_btn.setObjectName("revealKeyBtn")
         self.show_key_btn.toggled.connect(self._toggle_key_visibility)
 
         key_row = QHBoxLayout()
@@ -902,18 +1223,6 @@ class SettingsDialog(QDialog):
         mic_layout = QVBoxLayout(mic_group)
 
         self.mic_combo = QComboBox()
-        self.mic_combo.setStyleSheet("QComboBox { padding: 6px; }")
-
-        current_idx = 0
-        for i, device in enumerate(devices):
-            name = device['name'][:40]
-            if device['is_default']:
-                name += " *"
-            self.mic_combo.addItem(name, device['id'])
-            if device['id'] == current_device_id:
-                current_idx = i
-
-        self.mic_combo.setCurrentIndex(current_idx)
         mic_layout.addWidget(self.mic_combo)
         layout.addWidget(mic_group)
 
@@ -922,15 +1231,9 @@ class SettingsDialog(QDialog):
         lang_layout = QVBoxLayout(lang_group)
 
         self.lang_combo = QComboBox()
-        self.lang_combo.setStyleSheet("QComboBox { padding: 6px; }")
 
-        current_lang_idx = 0
-        for i, (code, name) in enumerate(LANGUAGES):
+        for code, name in LANGUAGES:
             self.lang_combo.addItem(name, code)
-            if code == current_language:
-                current_lang_idx = i
-
-        self.lang_combo.setCurrentIndex(current_lang_idx)
         lang_layout.addWidget(self.lang_combo)
         layout.addWidget(lang_group)
 
@@ -940,7 +1243,6 @@ class SettingsDialog(QDialog):
 
         # Button size combo
         self.size_combo = QComboBox()
-        self.size_combo.setStyleSheet("QComboBox { padding: 6px; }")
         size_options = [
             ("mini", t("size_mini")),
             ("small", t("size_small")),
@@ -948,29 +1250,18 @@ class SettingsDialog(QDialog):
             ("large", t("size_large")),
             ("xlarge", t("size_xlarge")),
         ]
-        current_size = settings.get("button_size", "normal")
-        current_size_idx = 0
-        for i, (key, label) in enumerate(size_options):
+        for key, label in size_options:
             self.size_combo.addItem(label, key)
-            if key == current_size:
-                current_size_idx = i
-        self.size_combo.setCurrentIndex(current_size_idx)
         appearance_layout.addRow(t("settings_button_size"), self.size_combo)
 
         # Orientation combo
         self.orientation_combo = QComboBox()
-        self.orientation_combo.setStyleSheet("QComboBox { padding: 6px; }")
         orientation_options = [
             ("vertical", t("orientation_vertical")),
             ("horizontal", t("orientation_horizontal")),
         ]
-        current_orientation = settings.get("orientation", "vertical")
-        current_orientation_idx = 0
-        for i, (key, label) in enumerate(orientation_options):
+        for key, label in orientation_options:
             self.orientation_combo.addItem(label, key)
-            if key == current_orientation:
-                current_orientation_idx = i
-        self.orientation_combo.setCurrentIndex(current_orientation_idx)
         appearance_layout.addRow(t("settings_orientation"), self.orientation_combo)
 
         layout.addWidget(appearance_group)
@@ -986,22 +1277,14 @@ class SettingsDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         ok_btn = QPushButton(t("settings_save"))
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        ok_btn.setObjectName("okBtn")
         ok_btn.clicked.connect(self._on_accept)
         btn_layout.addWidget(ok_btn)
 
         layout.addLayout(btn_layout)
 
+        self.refresh(devices, current_device_id)
+
         # Center on screen
         screen = QApplication.primaryScreen().geometry()
         self.move(
@@ -1009,6 +1292,36 @@ class SettingsDialog(QDialog):
             (screen.height() - self.height()) // 2,
         )
 
+    @staticmethod
+    def _select_data(combo: QComboBox, value):
+        """Select the item whose data is value, else the first item."""
+        combo.setCurrentIndex(max(combo.findData(value), 0))
+
+    def refresh(self, devices, current_device_id):
+        """Reload the mutable fields from settings before (re)showing."""
+        settings = get_settings()
+
+        self.selected_device_id = current_device_id
+        self.selected_language = self.lang
+        self.selected_api_key = None
+        self.selected_button_size = None
+        self.selected_orientation = None
+
+        self.show_key_btn.setChecked(False)
+        self.api_key_input.setText(settings.get("groq_api_key", "") or GROQ_API_KEY or "")
+
+        self.mic_combo.clear()
+        for device in devices:
+            name = device['name'][:40]
+            if device['is_default']:
+                name += " *"
+            self.mic_combo.addItem(name, device['id'])
+        self._select_data(self.mic_combo, current_device_id)
+
+        self._select_data(self.lang_combo, self.lang)
+        self._select_data(self.size_combo, settings.get("button_size", "normal"))
+        self._select_data(self.orientation_combo, settings.get("orientation", "vertical"))
+
     def _toggle_key_visibility(self, checked):
         """Toggle API key visibility."""
         self.api_key_input.setEchoMode(
@@ -1053,7 +1366,7 @@ class DeviceDialog(QDialog):
 
             lang_name = "Español" if lang == "es" else "English"
             subtitle = QLabel(f"{t('settings_language')}: {lang_name} | Model: {GROQ_MODEL}")
-            subtitle.setStyleSheet("color: #666;")
+            subtitle.setObjectName("dialogSubtitle")
             layout.addWidget(subtitle)
 
             layout.addSpacing(10)
@@ -1063,39 +1376,43 @@ class DeviceDialog(QDialog):
 
         # Device list
         self.list_widget = QListWidget()
-        self.list_widget.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QListWidget::item:selected {
-                background-color: #4CAF50;
-                color: white;
-            }
-            QListWidget::item:hover:!selected {
-                background-color: #e8f5e9;
-            }
-        """)
+        self.list_widget.setObjectName("deviceList")
+        # Selection colors via the palette rather than ::item QSS rules, and no
+        # hover tint, so moving the mouse over the list doesn't repaint rows
+        palette = self.list_widget.palette()
+        palette.setColor(QPalette.Highlight, COLORS['idle'])
+        palette.setColor(QPalette.HighlightedText, QColor("white"))
+        self.list_widget.setPalette(palette)
+        self.list_widget.setMouseTracking(False)
+        self.list_widget.viewport().setAttribute(Qt.WA_Hover, False)
 
         default_idx = 0
+        current_id = current_device['id'] if current_device else None
+        texts = []
+        ids = []
         for i, device in enumerate(devices):
-            text = device['name'][:45]
-            if device['is_default']:
-                text += " *"
+            device_id = device['id']
+            is_default = device['is_default']
+            if is_default:
                 default_idx = i
-            if current_device and device['id'] == current_device['id']:
-                text = "> " + text
-
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, device['id'])
-            self.list_widget.addItem(item)
-
-        self.list_widget.setCurrentRow(default_idx)
+            prefix = "> " if device_id == current_id else ""
+            suffix = " *" if is_default else ""
+            texts.append(f"{prefix}{device['name'][:45]}{suffix}")
+            ids.append(device_id)
+
+        # Insert all rows in one batch, without per-row relayouts or signals
+        lw = self.list_widget
+        lw.setUniformItemSizes(True)
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        lw.addItems(texts)
+        user_role = Qt.UserRole
+        for i, device_id in enumerate(ids):
+            lw.item(i).setData(user_role, device_id)
+        lw.blockSignals(False)
+        lw.setUpdatesEnabled(True)
+
+        lw.setCurrentRow(default_idx)
         layout.addWidget(self.list_widget)
 
         # Buttons
@@ -1107,19 +1424,7 @@ class DeviceDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         ok_btn = QPushButton(t("device_start") if initial else t("device_select_btn"))
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        ok_btn.setObjectName("okBtn")
         ok_btn.clicked.connect(self._on_accept)
         btn_layout.addWidget(ok_btn)
 
@@ -1159,7 +1464,7 @@ class ApiKeyDialog(QDialog):
         # Instruction
         hint = QLabel(t("settings_api_key_hint"))
         hint.setAlignment(Qt.AlignCenter)
-        hint.setStyleSheet("color: #888;")
+        hint.setObjectName("dialogHint")
         hint.setOpenExternalLinks(True)
         layout.addWidget(hint)
 
@@ -1168,7 +1473,7 @@ class ApiKeyDialog(QDialog):
         # API key input
         self.api_key_input = QLineEdit()
         self.api_key_input.setPlaceholderText("gsk_...")
-        self.api_key_input.setStyleSheet("QLineEdit { padding: 8px; font-size: 13px; }")
+        self.api_key_input.setObjectName("apiKeyInput")
         layout.addWidget(self.api_key_input)
 
         layout.addStretch()
@@ -1182,17 +1487,7 @@ class ApiKeyDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         ok_btn = QPushButton(t("settings_save"))
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #45a049; }
-        """)
+        ok_btn.setObjectName("okBtn")
         ok_btn.clicked.connect(self._on_accept)
         btn_layout.addWidget(ok_btn)
 
@@ -1205,6 +1500,40 @@ class ApiKeyDialog(QDialog):
             self.accept()
 
 
+# Dialog styles, set once on the QApplication so Qt parses them a single time
+_GLOBAL_QSS = """
+QPushButton#okBtn, QPushButton#helpOkBtn {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 8px 20px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton#helpOkBtn { padding: 8px; }
+QPushButton#okBtn:hover, QPushButton#helpOkBtn:hover { background-color: #45a049; }
+QPushButton#revealKeyBtn { border: none; font-size: 14px; }
+
+QListWidget#deviceList {
+    border: 1px solid #ccc;
+    border-radius: 4px;
+    padding: 4px;
+}
+QListWidget#deviceList::item {
+    padding: 8px;
+    border-radius: 4px;
+}
+
+QComboBox { padding: 6px; }
+QLineEdit#settingsKeyInput { padding: 6px; }
+QLineEdit#apiKeyInput { padding: 8px; font-size: 13px; }
+
+QLabel#helpLangLabel { color: #4CAF50; }
+QLabel#dialogSubtitle { color: #666; }
+QLabel#dialogHint { color: #888; }
+"""
+
+
 def _has_api_key() -> bool:
     """Check if a Groq API key is available from settings or env var."""
     saved = get_settings().get("groq_api_key", "")
@@ -1213,8 +1542,13 @@ def _has_api_key() -> bool:
 
 def main():
     """Entry point."""
+    # Only the recorder's INFO lines; httpx/faster-whisper stay at WARNING
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+    logging.getLogger("audio_recorder").setLevel(logging.INFO)
+
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(True)
+    app.setStyleSheet(_GLOBAL_QSS)
 
     # Load saved settings
     settings = get_settings()
@@ -1229,13 +1563,15 @@ def main():
             return 1
 
     # Create panel
-    panel = FloatingPanel()
+    panel = FloatingPanel(settings=settings)
 
-    # Create controller with callbacks
+    # Create controller with callbacks (first import of the audio/API stack,
+    # so cancelling the API key prompt above never pays for it)
     panel.controller = TranscriptionController(
         on_state_change=panel._on_state_change,
         on_transcription_complete=panel._on_transcription_complete,
         on_transcription_error=panel._on_transcription_error,
+        settings=settings,
     )
 
     # Set language from saved settings
@@ -12,14 +12,18 @@ Usage:
 """
 import os
 import sys
+import json
+import time
 import platform
 import subprocess
 import shutil
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 # --- Color support ---
 
+@lru_cache(maxsize=1)
 def _supports_color():
     """Check if terminal supports ANSI color codes."""
     if platform.system() == "Windows":
@@ -46,18 +50,75 @@ else:
 SCRIPT_DIR = Path(__file__).parent.resolve()
 PLAT = platform.system().lower()  # "linux", "darwin", "windows"
 
+# Results of the checks that spawn subprocesses, reused on warm starts
+# (disabled with --no-cache)
+LAUNCHER_CACHE = SCRIPT_DIR / ".launcher_cache.json"
+DEPS_CACHE_TTL = 24 * 3600   # system dependency check
+AUDIO_CACHE_TTL = 3600       # audio device list
+_cache_enabled = True
+
+# pip bundled with a new venv is used as-is from this major version on
+MIN_PIP_MAJOR = 23
+
 # --- Path helpers ---
 
+@lru_cache(maxsize=None)
 def get_venv_python():
     if PLAT == "windows":
         return SCRIPT_DIR / "venv" / "Scripts" / "python.exe"
     return SCRIPT_DIR / "venv" / "bin" / "python"
 
+@lru_cache(maxsize=None)
 def get_venv_pip():
     if PLAT == "windows":
         return SCRIPT_DIR / "venv" / "Scripts" / "pip.exe"
     return SCRIPT_DIR / "venv" / "bin" / "pip"
 
+def running_in_venv():
+    """True when this launcher is already executing under the project venv."""
+    return Path(sys.prefix).resolve() == (SCRIPT_DIR / "venv").resolve()
+
+# --- Launcher cache ---
+
+def _load_launcher_cache():
+    """Load cached check results, discarding them if the platform or Python changed."""
+    if not _cache_enabled:
+        return {}
+    try:
+        cache = json.loads(LAUNCHER_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("plat") != PLAT or cache.get("python") != sys.version:
+        return {}
+    return cache
+
+def _save_launcher_cache(cache):
+    """Write the cache to a temp file and rename it over the old one, so a
+    crash never leaves a truncated file (as settings.save_settings does)."""
+    if not _cache_enabled:
+        return
+    cache["plat"] = PLAT
+    cache["python"] = sys.version
+    tmp_path = LAUNCHER_CACHE.with_name(LAUNCHER_CACHE.name + ".tmp")
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(cache))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, LAUNCHER_CACHE)
+    except OSError:
+        pass
+
+def _venv_stamp():
+    """mtimes of the venv interpreter and deps marker; changes on reinstall."""
+    stamp = []
+    for path in (get_venv_python(), SCRIPT_DIR / ".deps_installed"):
+        try:
+            stamp.append(path.stat().st_mtime)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
 # --- Parse arguments ---
 
 def parse_args():
@@ -76,6 +137,10 @@ def parse_args():
         '--fix-audio', action='store_true',
         help='Attempt to restart audio subsystem if no devices found (Linux only)'
     )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Ignore and do not write the launcher cache (.launcher_cache.json)'
+    )
     parser.add_argument(
         '--with-whisper', action='store_true',
         help='Install full dependencies including Whisper local fallback (~300MB extra)'
@@ -84,19 +149,23 @@ def parse_args():
 
 # --- Banner ---
 
+_PLAT_NAME = {"linux": "Linux", "darwin": "macOS", "windows": "Windows"}.get(PLAT, PLAT)
+
+# Built once; only the mode label is filled in per launch
+_BANNER_TEMPLATE = (
+    f"{CYAN}========================================{NC}\n"
+    f"{CYAN}   Audio Transcription {{label}}{NC}\n"
+    f"{CYAN}   {DIM}{_PLAT_NAME} - Python {sys.version.split()[0]}{NC}\n"
+    f"{CYAN}========================================{NC}\n"
+)
+
 def print_banner(mode):
-    plat_name = {"linux": "Linux", "darwin": "macOS", "windows": "Windows"}.get(PLAT, PLAT)
-    label = "CLI" if mode == "cli" else "GUI"
-    print(f"{CYAN}========================================{NC}")
-    print(f"{CYAN}   Audio Transcription {label}{NC}")
-    print(f"{CYAN}   {DIM}{plat_name} - Python {sys.version.split()[0]}{NC}")
-    print(f"{CYAN}========================================{NC}")
-    print()
+    print(_BANNER_TEMPLATE.format(label="CLI" if mode == "cli" else "GUI"))
 
 # --- Python version check ---
 
 def check_python_version():
-    if sys.version_info < (3, 10):
+    if sys.hexversion < 0x030A0000:  # 3.10
         print(f"{RED}Error: Se requiere Python 3.10 o superior.{NC}")
         print(f"{DIM}Version actual: {sys.version}{NC}")
         if PLAT == "linux":
@@ -109,20 +178,44 @@ def check_python_version():
 
 # --- System dependency checks ---
 
-def check_system_dependencies():
-    """Check platform-specific system dependencies. Non-blocking (warnings only)."""
+def check_system_dependencies(cache, refresh=False):
+    """Check platform-specific system dependencies. Non-blocking (warnings only).
+
+    A clean result is cached for DEPS_CACHE_TTL so warm starts skip the
+    ldconfig/brew subprocesses. The cheap checks (clipboard tool) still
+    run and invalidate it, the Wayland warning is always shown, and
+    refresh (--fix-audio) forces a full check.
+    """
     print(f"{CYAN}Verificando dependencias del sistema...{NC}")
 
+    if (not refresh
+            and cache.get("deps_ok_at", 0) > time.time() - DEPS_CACHE_TTL
+            and (PLAT != "linux" or _has_clipboard_tool())):
+        print(f"  {GREEN}[OK]{NC} {DIM}Verificadas recientemente{NC}")
+        if PLAT == "linux":
+            _warn_wayland()
+        print()
+        return
+
+    ok = True
     if PLAT == "linux":
-        _check_linux_deps()
+        ok = _check_linux_deps()
     elif PLAT == "darwin":
-        _check_macos_deps()
+        ok = _check_macos_deps()
     elif PLAT == "windows":
-        _check_windows_deps()
+        ok = _check_windows_deps()
+
+    if ok:
+        cache["deps_ok_at"] = time.time()
+    else:
+        cache.pop("deps_ok_at", None)
+    _save_launcher_cache(cache)
 
     print()
 
 def _check_linux_deps():
+    ok = True
+
     # PortAudio
     try:
         result = subprocess.run(
@@ -131,16 +224,19 @@ def _check_linux_deps():
         if "portaudio" in result.stdout.lower():
             print(f"  {GREEN}[OK]{NC} PortAudio")
         else:
+            ok = False
             print(f"  {YELLOW}[!!]{NC} PortAudio no encontrado")
             print(f"       -> sudo apt install libportaudio2 {DIM}(Debian/Ubuntu){NC}")
             print(f"       -> sudo dnf install portaudio {DIM}(Fedora){NC}")
     except (FileNotFoundError, subprocess.TimeoutExpired):
+        ok = False
         print(f"  {DIM}[--] PortAudio: no se pudo verificar{NC}")
 
     # Clipboard (xclip or xsel)
-    if shutil.which("xclip") or shutil.which("xsel"):
+    if _has_clipboard_tool():
         print(f"  {GREEN}[OK]{NC} Clipboard (xclip/xsel)")
     else:
+        ok = False
         print(f"  {YELLOW}[!!]{NC} xclip/xsel no encontrado")
         print(f"       -> sudo apt install xclip")
         print(f"       -> El portapapeles no funcionara sin esto")
@@ -150,10 +246,19 @@ def _check_linux_deps():
         import venv  # noqa: F401
         print(f"  {GREEN}[OK]{NC} python3-venv")
     except ImportError:
+        ok = False
         print(f"  {RED}[!!]{NC} python3-venv no disponible")
         print(f"       -> sudo apt install python3-venv python3-full")
 
-    # Wayland warning for CLI mode
+    _warn_wayland()
+
+    return ok
+
+def _has_clipboard_tool():
+    return bool(shutil.which("xclip") or shutil.which("xsel"))
+
+def _warn_wayland():
+    """Wayland warning for CLI mode."""
     session_type = os.environ.get("XDG_SESSION_TYPE", "")
     if session_type == "wayland":
         print(f"  {YELLOW}[!!]{NC} Sesion Wayland detectada")
@@ -161,6 +266,8 @@ def _check_linux_deps():
         print(f"       -> Se recomienda usar modo GUI")
 
 def _check_macos_deps():
+    ok = True
+
     # PortAudio via Homebrew
     if shutil.which("brew"):
         try:
@@ -171,9 +278,11 @@ def _check_macos_deps():
             if result.returncode == 0:
                 print(f"  {GREEN}[OK]{NC} PortAudio (Homebrew)")
             else:
+                ok = False
                 print(f"  {YELLOW}[!!]{NC} PortAudio no instalado")
                 print(f"       -> brew install portaudio")
         except (FileNotFoundError, subprocess.TimeoutExpired):
+            ok = False
             print(f"  {DIM}[--] PortAudio: no se pudo verificar{NC}")
     else:
         # Check if portaudio lib exists in common locations
@@ -184,6 +293,7 @@ def _check_macos_deps():
         if any(p.exists() for p in portaudio_paths):
             print(f"  {GREEN}[OK]{NC} PortAudio")
         else:
+            ok = False
             print(f"  {YELLOW}[!!]{NC} PortAudio no encontrado")
             print(f"       -> Instalar Homebrew: https://brew.sh/")
             print(f"       -> Luego: brew install portaudio")
@@ -195,6 +305,8 @@ def _check_macos_deps():
     print(f"  {DIM}[i]{NC}  Modo CLI requiere permiso de Accesibilidad")
     print(f"       -> System Settings > Privacy & Security > Accessibility")
 
+    return ok
+
 def _check_windows_deps():
     # PortAudio is bundled with sounddevice on Windows
     print(f"  {GREEN}[OK]{NC} PortAudio (incluido con sounddevice)")
@@ -206,6 +318,8 @@ def _check_windows_deps():
     print(f"  {DIM}[i]{NC}  Asegurar acceso al microfono:")
     print(f"       -> Settings > Privacy & Security > Microphone")
 
+    return True
+
 # --- Virtual environment ---
 
 def ensure_venv():
@@ -221,10 +335,7 @@ def ensure_venv():
 
     print(f"{YELLOW}Creando entorno virtual...{NC}")
     try:
-        subprocess.check_call(
-            [sys.executable, "-m", "venv", str(venv_dir)],
-            stdout=subprocess.DEVNULL
-        )
+        _create_venv(venv_dir)
         print(f"{GREEN}Entorno virtual creado{NC}")
     except subprocess.CalledProcessError:
         print(f"{RED}Error creando venv.{NC}")
@@ -237,34 +348,60 @@ def ensure_venv():
             print(f"  Marcar 'Add Python to PATH' durante la instalacion")
         sys.exit(1)
 
+def _create_venv(venv_dir):
+    """Create the venv in-process; fall back to `python -m venv` on failure."""
+    try:
+        import venv
+        venv.EnvBuilder(
+            with_pip=True,
+            symlinks=(PLAT != "windows"),
+            system_site_packages=False,
+        ).create(str(venv_dir))
+        return
+    except Exception:
+        # e.g. ensurepip missing (Debian without python3-venv); retry the
+        # classic way so the error handling in ensure_venv still applies
+        shutil.rmtree(venv_dir, ignore_errors=True)
+    subprocess.check_call(
+        [sys.executable, "-m", "venv", str(venv_dir)],
+        stdout=subprocess.DEVNULL
+    )
+
 # --- Dependencies ---
 
 def ensure_dependencies(with_whisper=False):
     marker = SCRIPT_DIR / ".deps_installed"
     marker_full = SCRIPT_DIR / ".deps_full_installed"
+    base_req = SCRIPT_DIR / "requirements.txt"
+    full_req = SCRIPT_DIR / "requirements-full.txt"
 
-    # If requesting whisper and already have full deps, skip
-    if with_whisper and marker_full.exists():
-        return
-    # If not requesting whisper and already have deps, skip
-    if not with_whisper and marker.exists():
+    # Skip if the marker is newer than the requirements it was installed
+    # from (requirements-full.txt includes requirements.txt via -r)
+    if with_whisper:
+        if _marker_is_current(marker_full, base_req, full_req):
+            return
+    elif _marker_is_current(marker, base_req):
         return
 
     if with_whisper:
-        req = SCRIPT_DIR / "requirements-full.txt"
+        req = full_req
         print(f"{YELLOW}Instalando dependencias completas (con Whisper)...{NC}")
     else:
-        req = SCRIPT_DIR / "requirements.txt"
+        req = base_req
         print(f"{YELLOW}Instalando dependencias (primera vez)...{NC}")
 
     pip = get_venv_pip()
 
     try:
-        subprocess.check_call(
-            [str(pip), "install", "--upgrade", "pip", "-q"],
-            stdout=subprocess.DEVNULL
-        )
-        subprocess.check_call([str(pip), "install", "-r", str(req)])
+        if not _venv_pip_is_recent():
+            subprocess.check_call(
+                [str(pip), "install", "--upgrade", "pip", "-q"],
+                stdout=subprocess.DEVNULL
+            )
+        subprocess.check_call([
+            str(pip), "install", "-r", str(req),
+            "--disable-pip-version-check", "--no-input",
+        ])
         marker.touch()
         if with_whisper:
             marker_full.touch()
@@ -275,12 +412,60 @@ def ensure_dependencies(with_whisper=False):
         print(f"  {str(pip)} install -r {str(req)}")
         sys.exit(1)
 
+def _marker_is_current(marker, *requirements):
+    """True if marker exists and is at least as new as every requirements file."""
+    try:
+        marker_mtime = marker.stat().st_mtime
+    except OSError:
+        return False
+    for req in requirements:
+        try:
+            if req.stat().st_mtime > marker_mtime:
+                return False
+        except OSError:
+            pass
+    return True
+
+def _venv_pip_is_recent():
+    """Whether the venv's pip is new enough (MIN_PIP_MAJOR) to skip upgrading it.
+
+    Asks the in-process pip when running in the venv, otherwise
+    `pip --version` (local, unlike the upgrade's network round-trip).
+    """
+    try:
+        if running_in_venv():
+            import pip
+            version = pip.__version__
+        else:
+            result = subprocess.run(
+                [str(get_venv_pip()), "--version"],
+                capture_output=True, text=True, timeout=10
+            )
+            # "pip 24.0 from ... (python 3.12)"
+            version = result.stdout.split()[1]
+        return int(version.split(".")[0]) >= MIN_PIP_MAJOR
+    except (ImportError, OSError, IndexError, ValueError, subprocess.TimeoutExpired):
+        return False
+
 # --- Audio device verification ---
 
-def verify_audio_devices(fix_audio=False):
-    """Check for available input devices using venv python + sounddevice."""
+def verify_audio_devices(cache, fix_audio=False):
+    """Check for available input devices using venv python + sounddevice.
+
+    A non-empty device list is cached for AUDIO_CACHE_TTL (and as long as
+    the venv is unchanged); --fix-audio always runs a fresh check.
+    """
     print(f"{CYAN}Verificando dispositivos de audio...{NC}")
 
+    stamp = _venv_stamp()
+    if (not fix_audio
+            and cache.get("audio_devices")
+            and cache.get("audio_stamp") == stamp
+            and cache.get("audio_at", 0) > time.time() - AUDIO_CACHE_TTL):
+        print(f"{GREEN}Dispositivos disponibles:{NC} {DIM}(cache){NC}")
+        print(cache["audio_devices"])
+        return True
+
     venv_py = get_venv_python()
     check_script = (
         "import sounddevice as sd\n"
@@ -296,6 +481,7 @@ def verify_audio_devices(fix_audio=False):
     if devices_output:
         print(f"{GREEN}Dispositivos disponibles:{NC}")
         print(devices_output)
+        _cache_audio_devices(cache, devices_output, stamp)
         return True
 
     # No devices found
@@ -303,17 +489,42 @@ def verify_audio_devices(fix_audio=False):
 
     if fix_audio and PLAT == "linux":
         _try_linux_audio_restart()
-        devices_output = _run_audio_check(venv_py, check_script)
+        devices_output = _run_audio_check(venv_py, check_script, fresh_process=True)
         if devices_output:
             print(f"{GREEN}Dispositivos encontrados tras reinicio:{NC}")
             print(devices_output)
+            _cache_audio_devices(cache, devices_output, stamp)
             return True
 
+    _cache_audio_devices(cache, None, stamp)
     _print_audio_troubleshooting()
     return False
 
-def _run_audio_check(venv_py, script):
-    """Run audio device check script and return stdout or empty string."""
+def _cache_audio_devices(cache, devices_output, stamp):
+    """Store (or with None, forget) the last successful device listing."""
+    if devices_output:
+        cache["audio_devices"] = devices_output
+        cache["audio_stamp"] = stamp
+        cache["audio_at"] = time.time()
+    else:
+        for key in ("audio_devices", "audio_stamp", "audio_at"):
+            cache.pop(key, None)
+    _save_launcher_cache(cache)
+
+def _run_audio_check(venv_py, script, fresh_process=False):
+    """Run audio device check script and return stdout or empty string.
+
+    Inside the venv the script runs in-process, saving an interpreter start,
+    unless fresh_process is set (PortAudio caches its device list once
+    initialized, so re-checks after an audio restart need a new process).
+    The launcher queries at most twice before exec'ing the app, which
+    lists devices in-process, so there is nothing for a long-lived helper
+    process to amortize.
+    """
+    if running_in_venv() and not fresh_process:
+        output = _run_audio_check_in_process(script)
+        if output is not None:
+            return output
     try:
         result = subprocess.run(
             [str(venv_py), "-c", script],
@@ -323,10 +534,21 @@ def _run_audio_check(venv_py, script):
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return ""
 
+def _run_audio_check_in_process(script):
+    """exec() the check script here, capturing its output; None if it fails."""
+    import contextlib
+    import io
+
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            exec(script, {})
+    except Exception:
+        return None
+    return buf.getvalue().strip()
+
 def _try_linux_audio_restart():
     """Attempt to restart the Linux audio subsystem (PipeWire or PulseAudio)."""
-    import time
-
     if shutil.which("pipewire"):
         print(f"{YELLOW}Reiniciando PipeWire...{NC}")
         subprocess.run(
@@ -394,6 +616,7 @@ def run_application(mode):
 # --- Main ---
 
 def main():
+    global _cache_enabled
     args = parse_args()
     mode = "cli" if args.cli else "gui"
 
@@ -414,12 +637,14 @@ def main():
 
     print_banner(mode)
     check_python_version()
-    check_system_dependencies()
+    _cache_enabled = not args.no_cache
+    cache = _load_launcher_cache()
+    check_system_dependencies(cache, refresh=args.fix_audio)
     ensure_venv()
     ensure_dependencies(with_whisper=args.with_whisper)
 
     if not args.skip_audio_check:
-        verify_audio_devices(fix_audio=args.fix_audio)
+        verify_audio_devices(cache, fix_audio=args.fix_audio)
         print()
 
     run_application(mode)
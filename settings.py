@@ -3,6 +3,21 @@ Persistent settings and translations for the transcription app.
 """
 import json
 import os
+from types import MappingProxyType
+
+# orjson is optional: faster (de)serialization when installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=True).encode()
+
+    _loads = json.loads
 
 # Settings file path (same directory as the script)
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "app_settings.json")
@@ -16,149 +31,109 @@ DEFAULT_SETTINGS = {
     "orientation": "vertical",  # vertical, horizontal
 }
 
-# Translations
-TRANSLATIONS = {
-    "es": {
-        "help_title": "Ayuda",
-        "help_app_title": "Audio Transcription",
-        "help_current_lang": "Idioma actual",
-        "help_record": "Grabar",
-        "help_record_desc": "Inicia la grabacion de voz",
-        "help_stop": "Stop",
-        "help_stop_desc": "Detiene y transcribe. Se copia al portapapeles",
-        "help_pause": "Pausa",
-        "help_pause_desc": "Pausa temporalmente (no graba)",
-        "help_resume": "Reanudar",
-        "help_resume_desc": "Continua grabando",
-        "help_cancel": "Cancelar",
-        "help_cancel_desc": "Descarta sin transcribir",
-        "help_buttons": "Botones inferiores",
-        "help_tip": "Tip: Podes arrastrar el panel.",
-        "help_ok": "OK",
-        "settings_title": "Opciones",
-        "settings_microphone": "Microfono",
-        "settings_language": "Idioma",
-        "settings_cancel": "Cancelar",
-        "settings_save": "Guardar",
-        "settings_saved": "Guardado",
-        "settings_saved_msg": "Configuracion guardada.",
-        "device_title": "Audio Transcription",
-        "device_select": "Selecciona tu microfono:",
-        "device_cancel": "Cancelar",
-        "device_start": "Iniciar",
-        "device_select_btn": "Seleccionar",
-        "tooltip_help": "Ayuda",
-        "tooltip_settings": "Opciones",
-        "tooltip_exit": "Salir",
-        "settings_api_key": "Clave API Groq",
-        "settings_api_key_hint": "Obtener gratis en console.groq.com",
-        "settings_appearance": "Apariencia",
-        "settings_button_size": "Tamano de botones",
-        "settings_orientation": "Orientacion del panel",
-        "size_mini": "Mini",
-        "size_small": "Chico",
-        "size_normal": "Normal",
-        "size_large": "Grande",
-        "size_xlarge": "Muy grande",
-        "orientation_vertical": "Vertical",
-        "orientation_horizontal": "Horizontal",
-    },
-    "en": {
-        "help_title": "Help",
-        "help_app_title": "Audio Transcription",
-        "help_current_lang": "Current language",
-        "help_record": "Record",
-        "help_record_desc": "Start voice recording",
-        "help_stop": "Stop",
-        "help_stop_desc": "Stop and transcribe. Copied to clipboard",
-        "help_pause": "Pause",
-        "help_pause_desc": "Pause temporarily (not recording)",
-        "help_resume": "Resume",
-        "help_resume_desc": "Continue recording",
-        "help_cancel": "Cancel",
-        "help_cancel_desc": "Discard without transcribing",
-        "help_buttons": "Bottom buttons",
-        "help_tip": "Tip: You can drag the panel.",
-        "help_ok": "OK",
-        "settings_title": "Settings",
-        "settings_microphone": "Microphone",
-        "settings_language": "Language",
-        "settings_cancel": "Cancel",
-        "settings_save": "Save",
-        "settings_saved": "Saved",
-        "settings_saved_msg": "Settings saved.",
-        "device_title": "Audio Transcription",
-        "device_select": "Select your microphone:",
-        "device_cancel": "Cancel",
-        "device_start": "Start",
-        "device_select_btn": "Select",
-        "tooltip_help": "Help",
-        "tooltip_settings": "Settings",
-        "tooltip_exit": "Exit",
-        "settings_api_key": "Groq API Key",
-        "settings_api_key_hint": "Get free at console.groq.com",
-        "settings_appearance": "Appearance",
-        "settings_button_size": "Button size",
-        "settings_orientation": "Panel orientation",
-        "size_mini": "Mini",
-        "size_small": "Small",
-        "size_normal": "Normal",
-        "size_large": "Large",
-        "size_xlarge": "Extra large",
-        "orientation_vertical": "Vertical",
-        "orientation_horizontal": "Horizontal",
-    }
-}
+# Translations live in translations.json and are loaded on first use
+TRANSLATIONS_FILE = os.path.join(os.path.dirname(__file__), "translations.json")
+_translations = None
+
+
+def _load_translations() -> dict:
+    """Return all translation tables, reading TRANSLATIONS_FILE once."""
+    global _translations
+    if _translations is None:
+        with open(TRANSLATIONS_FILE, 'rb') as f:
+            _translations = _loads(f.read())
+    return _translations
+
+
+def get_translations(lang: str) -> dict:
+    """Translation table for lang (Spanish if unknown)."""
+    translations = _load_translations()
+    return translations.get(lang) or translations["es"]
+
+
+# Serialized form of what SETTINGS_FILE currently holds, to skip no-op saves
+_last_written_blob = None
 
 
 def load_settings() -> dict:
     """Load settings from file or return defaults."""
+    global _last_written_blob
     try:
         if os.path.exists(SETTINGS_FILE):
-            with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
-                # Merge with defaults for any missing keys
-                return {**DEFAULT_SETTINGS, **settings}
+            with open(SETTINGS_FILE, 'rb') as f:
+                settings = _loads(f.read())
+            _last_written_blob = _dumps(settings)
+            # Merge with defaults for any missing keys
+            merged = DEFAULT_SETTINGS.copy()
+            merged.update(settings)
+            return merged
     except Exception:
         pass
     return DEFAULT_SETTINGS.copy()
 
 
 def save_settings(settings: dict):
-    """Save settings to file."""
+    """Save settings to file.
+
+    Skipped when nothing changed; otherwise written to a temp file and
+    renamed over the old one, so a crash never leaves a truncated file.
+    """
+    global _last_written_blob
+    blob = _dumps(settings)
+    if blob == _last_written_blob:
+        return
+
+    tmp_path = SETTINGS_FILE + ".tmp"
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=2)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, SETTINGS_FILE)
+        _last_written_blob = blob
     except Exception as e:
         print(f"Error saving settings: {e}")
 
 
+# Translation table for the saved language; resolved on first use and
+# reset by update_settings(language=...)
+_active_lang = None
+_active_table = None
+
+
 def get_text(key: str, lang: str = None) -> str:
     """Get translated text for the given key."""
+    global _active_lang, _active_table
     if lang is None:
-        lang = load_settings().get("language", "es")
+        if _active_lang is None:
+            _active_lang = get_settings().get("language", "es")
+            _active_table = get_translations(_active_lang)
+        return _active_table.get(key, key)
 
-    translations = TRANSLATIONS.get(lang, TRANSLATIONS["es"])
-    return translations.get(key, key)
+    return get_translations(lang).get(key, key)
 
 
-# Global settings instance
+# Global settings instance and the read-only view handed to callers
 _current_settings = None
+_current_settings_view = None
 
 
-def get_settings() -> dict:
-    """Get current settings (cached)."""
-    global _current_settings
-    if _current_settings is None:
+def get_settings() -> MappingProxyType:
+    """Get current settings (cached, read-only; change them with update_settings)."""
+    global _current_settings, _current_settings_view
+    if _current_settings_view is None:
         _current_settings = load_settings()
-    return _current_settings
+        _current_settings_view = MappingProxyType(_current_settings)
+    return _current_settings_view
 
 
 def update_settings(**kwargs):
     """Update and save settings."""
-    global _current_settings
-    settings = get_settings()
-    settings.update(kwargs)
-    save_settings(settings)
-    _current_settings = settings
-    return settings
+    global _active_lang
+    if "language" in kwargs:
+        _active_lang = None
+    get_settings()
+    _current_settings.update(kwargs)
+    save_settings(_current_settings)
+    return _current_settings_view
@@ -8,81 +8,77 @@ Usa Groq API (gratis) con fallback a Whisper local.
 Usage:
     python transcribe.py
 """
-import os
 import sys
 import signal
+import logging
 from pynput import keyboard
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.panel import Panel
 
-from config import HOTKEY, COPY_TO_CLIPBOARD, LANGUAGE, GROQ_MODEL
-from audio_recorder import AudioRecorder
-from transcription_service import TranscriptionService
+from config import HOTKEY, LANGUAGE, GROQ_MODEL
+from transcription_controller import TranscriptionController
 
 console = Console()
 
+# Status levels that stand out; everything else is progress, shown dim
+_STATUS_STYLES = {"ok": "green", "warning": "yellow", "error": "red"}
+
+
+def _normalize_hotkey(hotkey_str: str) -> str:
+    """Convert '<ctrl>+<alt>+space' into pynput's '<ctrl>+<alt>+<space>' form.
+
+    Multi-character names must be wrapped in <...> for HotKey.parse;
+    config has historically allowed them bare.
+    """
+    parts = []
+    for part in hotkey_str.lower().split('+'):
+        part = part.strip()
+        if len(part) > 1 and not part.startswith('<'):
+            part = f"<{part}>"
+        parts.append(part)
+    return '+'.join(parts)
+
+
+# HOTKEY in GlobalHotKeys form, computed once at import
+HOTKEY_COMBO = _normalize_hotkey(HOTKEY)
+
+# Used instead of a TRANSCRIBE_HOTKEY that pynput can't parse
+DEFAULT_HOTKEY = "<ctrl>+<alt>+space"
+
 
 class TranscriptionApp:
     """Main application for audio transcription with hotkey toggle."""
 
     def __init__(self):
-        self.recorder = AudioRecorder()
-        self.transcriber = TranscriptionService()
-        self.is_recording = False
+        self.controller = TranscriptionController(
+            on_transcription_complete=self._on_transcription_complete,
+            on_transcription_error=self._on_transcription_error,
+            on_status_message=self._on_status_message,
+        )
         self.running = True
-        self.current_keys = set()
-
-        # Parse hotkey
-        self.hotkey_parts = self._parse_hotkey(HOTKEY)
-
-    def _parse_hotkey(self, hotkey_str: str) -> set:
-        """Parse hotkey string like '<ctrl>+<alt>+space' into key set."""
-        parts = hotkey_str.lower().replace('<', '').replace('>', '').split('+')
-        key_set = set()
-
-        for part in parts:
-            part = part.strip()
-            if part == 'ctrl':
-                key_set.add(keyboard.Key.ctrl_l)
-                key_set.add(keyboard.Key.ctrl_r)
-            elif part == 'alt':
-                key_set.add(keyboard.Key.alt_l)
-                key_set.add(keyboard.Key.alt_r)
-            elif part == 'shift':
-                key_set.add(keyboard.Key.shift_l)
-                key_set.add(keyboard.Key.shift_r)
-            elif part == 'space':
-                key_set.add(keyboard.Key.space)
-            elif len(part) == 1:
-                key_set.add(keyboard.KeyCode.from_char(part))
-            else:
-                # Try as special key
-                try:
-                    key_set.add(getattr(keyboard.Key, part))
-                except AttributeError:
-                    console.print(f"[yellow]Tecla desconocida: {part}[/yellow]")
-
-        return key_set
-
-    def _check_hotkey_pressed(self) -> bool:
-        """Check if the hotkey combination is currently pressed."""
-        # Need ctrl (left or right)
-        has_ctrl = (keyboard.Key.ctrl_l in self.current_keys or
-                    keyboard.Key.ctrl_r in self.current_keys)
-        # Need alt (left or right)
-        has_alt = (keyboard.Key.alt_l in self.current_keys or
-                   keyboard.Key.alt_r in self.current_keys)
-        # Need space
-        has_space = keyboard.Key.space in self.current_keys
-
-        return has_ctrl and has_alt and has_space
+        self._listener = None
+
+        # A misspelt TRANSCRIBE_HOTKEY would make GlobalHotKeys raise;
+        # report it and keep running with the default instead
+        self.hotkey = HOTKEY
+        self._hotkey_combo = HOTKEY_COMBO
+        try:
+            keyboard.HotKey.parse(HOTKEY_COMBO)
+        except ValueError as e:
+            console.print(
+                f"[yellow]TRANSCRIBE_HOTKEY no valido ({HOTKEY!r}: {e}). "
+                f"Usando {DEFAULT_HOTKEY}[/yellow]"
+            )
+            self.hotkey = DEFAULT_HOTKEY
+            self._hotkey_combo = _normalize_hotkey(DEFAULT_HOTKEY)
 
     def setup(self):
         """Initial setup: show banner and select microphone."""
         console.print()
         console.print(Panel.fit(
             "[bold cyan]Audio Transcription CLI[/bold cyan]\n\n"
-            f"Hotkey: [green]{HOTKEY}[/green]\n"
+            f"Hotkey: [green]{self.hotkey}[/green]\n"
             f"Idioma: [yellow]{LANGUAGE}[/yellow]\n"
             f"Modelo: [dim]{GROQ_MODEL}[/dim]",
             title="Config",
@@ -90,86 +86,57 @@ class TranscriptionApp:
         ))
 
         console.print("\n[bold]Paso 1: Selecciona tu microfono[/bold]\n")
-        self.recorder.select_device_interactive()
+        self.controller.recorder.select_device_interactive()
 
     def toggle_recording(self):
-        """Toggle recording state."""
-        if self.is_recording:
-            # Stop recording and transcribe
-            self.is_recording = False
-            console.print("\n[yellow]Procesando...[/yellow]")
-
-            audio_path = self.recorder.stop_recording()
-
-            if audio_path:
-                # Transcribe
-                text = self.transcriber.transcribe(audio_path)
-
-                if text:
-                    # Show result
-                    console.print()
-                    console.print(Panel(
-                        text,
-                        title="Transcripcion",
-                        border_style="green",
-                        padding=(1, 2)
-                    ))
-
-                    # Copy to clipboard
-                    if COPY_TO_CLIPBOARD:
-                        try:
-                            import pyperclip
-                            pyperclip.copy(text)
-                            console.print("[dim]Copiado al portapapeles[/dim]")
-                        except ImportError:
-                            console.print(
-                                "[dim]pyperclip no instalado, "
-                                "no se pudo copiar[/dim]"
-                            )
-                        except Exception as e:
-                            console.print(f"[dim]No se pudo copiar: {e}[/dim]")
-
-                # Cleanup temp file
-                try:
-                    os.unlink(audio_path)
-                except Exception:
-                    pass
-
-            console.print(
-                f"\n[dim]Presiona {HOTKEY} para grabar, Ctrl+C para salir[/dim]"
-            )
-
+        """Toggle recording state.
+
+        Runs on the hotkey listener thread, so it only starts/stops the
+        controller; transcription happens on the controller's worker thread
+        and results arrive through the callbacks below.
+        """
+        if self.controller.is_idle():
+            if self.controller.start_recording():
+                console.print(
+                    f"\n[bold red]GRABANDO...[/bold red] "
+                    f"(presiona {self.hotkey} para detener)"
+                )
+        elif self.controller.is_recording():
+            self.controller.stop_recording()
         else:
-            # Start recording
-            self.is_recording = True
-            console.print(
-                f"\n[bold red]GRABANDO...[/bold red] "
-                f"(presiona {HOTKEY} para detener)"
-            )
-            self.recorder.start_recording()
+            console.print("[dim]Transcripcion en curso, espera...[/dim]")
 
-    def on_press(self, key):
-        """Handle key press events."""
-        self.current_keys.add(key)
+    def _print_hint(self):
+        console.print(
+            f"\n[dim]Presiona {self.hotkey} para grabar, Ctrl+C para salir[/dim]"
+        )
 
-        if self._check_hotkey_pressed():
-            # Debounce: only toggle if we weren't already in hotkey state
-            if not hasattr(self, '_hotkey_active') or not self._hotkey_active:
-                self._hotkey_active = True
-                self.toggle_recording()
+    def _on_transcription_complete(self, text: str):
+        """Show the result (worker thread; the controller copies it right after)."""
+        console.print()
+        console.print(Panel(
+            text,
+            title="Transcripcion",
+            border_style="green",
+            padding=(1, 2)
+        ))
+        self._print_hint()
 
-    def on_release(self, key):
-        """Handle key release events."""
-        self.current_keys.discard(key)
+    def _on_transcription_error(self, error: str):
+        console.print(f"[red]{error}[/red]")
+        self._print_hint()
 
-        # Reset hotkey active state when any part of combo is released
-        if not self._check_hotkey_pressed():
-            self._hotkey_active = False
+    def _on_status_message(self, message: str, level: str):
+        # Plain text (may quote API responses), so no markup parsing
+        console.print(
+            message, style=_STATUS_STYLES.get(level, "dim"),
+            markup=False, highlight=False
+        )
 
-        # Check for Escape to exit
-        if key == keyboard.Key.esc:
-            console.print("\n[yellow]Saliendo...[/yellow]")
-            return False  # Stop listener
+    def _exit(self):
+        """Esc: stop the hotkey listener, ending run()."""
+        console.print("\n[yellow]Saliendo...[/yellow]")
+        self._listener.stop()
 
     def run(self):
         """Main run loop."""
@@ -177,15 +144,18 @@ class TranscriptionApp:
 
         console.print(f"\n[bold green]Listo![/bold green]")
         console.print(
-            f"Presiona [cyan]{HOTKEY}[/cyan] para iniciar/detener grabacion"
+            f"Presiona [cyan]{self.hotkey}[/cyan] para iniciar/detener grabacion"
         )
         console.print("[dim]Presiona Ctrl+C o Esc para salir[/dim]\n")
 
-        # Setup keyboard listener
-        with keyboard.Listener(
-            on_press=self.on_press,
-            on_release=self.on_release
-        ) as listener:
+        # pynput matches the combos itself (left/right modifiers canonicalized)
+        # and calls back once per press of the full combo
+        hotkeys = {
+            self._hotkey_combo: self.toggle_recording,
+            '<esc>': self._exit,
+        }
+        with keyboard.GlobalHotKeys(hotkeys) as listener:
+            self._listener = listener
             try:
                 listener.join()
             except KeyboardInterrupt:
@@ -194,6 +164,15 @@ class TranscriptionApp:
 
 def main():
     """Entry point."""
+    # Recorder/status messages go through logging; render them on our console.
+    # Root stays at WARNING so httpx/faster-whisper INFO lines don't show
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(message)s",
+        handlers=[RichHandler(console=console, show_time=False, show_path=False)]
+    )
+    logging.getLogger("audio_recorder").setLevel(logging.INFO)
+
     # Handle Ctrl+C gracefully
     def signal_handler(sig, frame):
         console.print("\n[yellow]Saliendo...[/yellow]")
@@ -4,13 +4,10 @@ Transcription Controller - Reusable orchestration logic.
 Extracts transcription logic from TranscriptionApp for use by different UIs
 (CLI, GUI, etc.) with thread-safe callbacks.
 """
-import os
 import threading
-from typing import Callable, Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Mapping
 from enum import Enum, auto
 
-from audio_recorder import AudioRecorder
-from transcription_service import TranscriptionService
 from config import COPY_TO_CLIPBOARD, LANGUAGE
 
 
@@ -37,7 +34,8 @@ class TranscriptionController:
         on_recording_stop: Optional[Callable[[], None]] = None,
         on_transcription_complete: Optional[Callable[[str], None]] = None,
         on_transcription_error: Optional[Callable[[str], None]] = None,
-        on_status_message: Optional[Callable[[str], None]] = None,
+        on_status_message: Optional[Callable[[str, str], None]] = None,
+        settings: Optional[Mapping[str, Any]] = None,
     ):
         """
         Initialize the controller with optional callbacks.
@@ -48,10 +46,25 @@ class TranscriptionController:
             on_recording_stop: Called when recording stops (before processing)
             on_transcription_complete: Called with transcribed text
             on_transcription_error: Called with error message
-            on_status_message: Called with status messages for display
+            on_status_message: Called with (message, level) for display;
+                level is "info", "ok", "warning", "error" or "detail"
+            settings: Settings mapping already loaded by the caller
+                (defaults to settings.get_settings())
         """
+        # Imported here, not at module level: they pull in sounddevice and
+        # scipy, and UIs import this module (for TranscriptionState)
+        # before they know the user will get as far as recording
+        from audio_recorder import AudioRecorder
+        from transcription_service import TranscriptionService
+
         self.recorder = AudioRecorder()
-        self.transcriber = TranscriptionService()
+        # Service progress/errors go through on_status_message when the UI
+        # shows them; otherwise the service prints them itself
+        self.transcriber = TranscriptionService(
+            settings=settings,
+            status_cb=(lambda level, message: self._emit_status(message, level))
+            if on_status_message else None,
+        )
 
         self._state = TranscriptionState.IDLE
         self._lock = threading.Lock()
@@ -76,10 +89,10 @@ class TranscriptionController:
         if self.on_state_change:
             self.on_state_change(new_state)
 
-    def _emit_status(self, message: str):
+    def _emit_status(self, message: str, level: str = "info"):
         """Emit a status message."""
         if self.on_status_message:
-            self.on_status_message(message)
+            self.on_status_message(message, level)
 
     def get_available_devices(self) -> List[Dict[str, Any]]:
         """
@@ -90,6 +103,10 @@ class TranscriptionController:
         """
         return self.recorder.list_devices()
 
+    def _devices_by_id(self) -> Dict[int, Dict[str, Any]]:
+        """Get available input devices keyed by device ID."""
+        return {d['id']: d for d in self.get_available_devices()}
+
     def select_device(self, device_id: int) -> bool:
         """
         Select an audio input device by ID.
@@ -100,8 +117,7 @@ class TranscriptionController:
         Returns:
             True if device was selected successfully
         """
-        devices = self.get_available_devices()
-        device = next((d for d in devices if d['id'] == device_id), None)
+        device = self._devices_by_id().get(device_id)
 
         if device:
             self.recorder.device_id = device_id
@@ -114,8 +130,7 @@ class TranscriptionController:
         """Get the currently selected device info."""
         if self.recorder.device_id is None:
             return None
-        devices = self.get_available_devices()
-        return next((d for d in devices if d['id'] == self.recorder.device_id), None)
+        return self._devices_by_id().get(self.recorder.device_id)
 
     def start_recording(self) -> bool:
         """
@@ -124,6 +139,11 @@ class TranscriptionController:
         Returns:
             True if recording started successfully
         """
+        # Unlocked pre-check: a repeated hotkey press is rejected without
+        # waiting behind a transition in progress (re-checked under the lock)
+        if self._state != TranscriptionState.IDLE:
+            return False
+
         with self._lock:
             if self._state != TranscriptionState.IDLE:
                 return False
@@ -136,6 +156,9 @@ class TranscriptionController:
                     self.on_recording_start()
 
                 self._emit_status("Grabando...")
+
+                # Load httpx while the user speaks rather than after
+                threading.Thread(target=self.transcriber.preload, daemon=True).start()
                 return True
 
             except Exception as e:
@@ -151,6 +174,9 @@ class TranscriptionController:
         Returns:
             True if stop was initiated successfully
         """
+        if self._state not in (TranscriptionState.RECORDING, TranscriptionState.PAUSED):
+            return False
+
         with self._lock:
             if self._state not in (TranscriptionState.RECORDING, TranscriptionState.PAUSED):
                 return False
@@ -179,29 +205,29 @@ class TranscriptionController:
                 return
 
             self._emit_status("Transcribiendo...")
-            text = self.transcriber.transcribe(audio_path)
-
-            # Cleanup temp file
             try:
-                os.unlink(audio_path)
-            except Exception:
-                pass
+                text = self.transcriber.transcribe(audio_path)
+            finally:
+                # Removes the recording's temp directory with everything in it
+                self.recorder.cleanup()
 
             if text:
-                # Copy to clipboard if enabled
+                self.state = TranscriptionState.IDLE
+                if self.on_transcription_complete:
+                    self.on_transcription_complete(text)
+
+                # Copy to clipboard if enabled. After the result is shown:
+                # pyperclip shells out to xclip/wl-copy on Linux, which can
+                # take a noticeable fraction of a second
                 if COPY_TO_CLIPBOARD:
                     try:
                         import pyperclip
                         pyperclip.copy(text)
-                        self._emit_status("Copiado al portapapeles")
+                        self._emit_status("Copiado al portapapeles", "ok")
                     except ImportError:
-                        self._emit_status("Texto transcrito (pyperclip no instalado)")
+                        self._emit_status("Texto transcrito (pyperclip no instalado)", "warning")
                     except Exception as e:
-                        self._emit_status(f"Texto transcrito (portapapeles no disponible: {e})")
-
-                self.state = TranscriptionState.IDLE
-                if self.on_transcription_complete:
-                    self.on_transcription_complete(text)
+                        self._emit_status(f"Texto transcrito (portapapeles no disponible: {e})", "warning")
             else:
                 self.state = TranscriptionState.IDLE
                 if self.on_transcription_error:
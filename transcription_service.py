@@ -1,7 +1,19 @@
 """
 Transcription services: Groq API (primary) + Whisper local (fallback).
 """
-import httpx
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
 from rich.console import Console
 
 from config import (
@@ -9,74 +21,381 @@ from config import (
     GROQ_ENDPOINT,
     GROQ_MODEL,
     LANGUAGE,
+    TRANSCRIPT_CACHE,
     WHISPER_MODEL,
-    WHISPER_DEVICE
+    WHISPER_DEVICE,
+    WHISPER_WARMUP
 )
 from settings import get_settings
 
-console = Console()
+if TYPE_CHECKING:
+    import httpx
+
+# Fallback output when no status callback is given; messages are plain
+# text, so markup parsing and highlighting are off
+console = Console(highlight=False, soft_wrap=True)
+_STATUS_STYLES = {
+    "info": "cyan",
+    "ok": "green",
+    "warning": "yellow",
+    "error": "red",
+    "detail": "dim",
+}
+
+# Transcripts keyed by hash of (language, audio bytes); LRU, kept across runs
+TRANSCRIPT_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".cache", "audio-transcribe", "cache.json"
+)
+TRANSCRIPT_CACHE_SIZE = 128
+
+# Silence trimming: frame energy relative to the loudest frame decides speech
+TRIM_FRAME_SECONDS = 0.03
+TRIM_PADDING_SECONDS = 0.3
+TRIM_FLOOR = 10 ** (-45 / 20)     # absolute floor, ~-45 dBFS
+TRIM_RELATIVE = 10 ** (-30 / 20)  # 30 dB below the loudest frame
+TRIM_MIN_SAVING = 0.05            # skip the rewrite below 5% saved
+
+# Long recordings go to Groq as chunks split at pauses, uploaded in parallel
+GROQ_CHUNK_SECONDS = 25
+GROQ_SPLIT_WINDOW_SECONDS = 5     # how far back from the limit to look for a pause
+GROQ_CHUNK_WORKERS = 4
+
+# Fail fast when Groq is unreachable: short connect timeout, and after
+# repeated failures skip Groq for a while (doubling up to the cap) when
+# the local fallback is installed
+GROQ_CONNECT_TIMEOUT = 3.0
+GROQ_BREAKER_FAILURES = 3
+GROQ_BREAKER_SECONDS = 60
+GROQ_BREAKER_MAX_SECONDS = 600
+
+@lru_cache(maxsize=None)
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@lru_cache(maxsize=None)
+def resolve_whisper_device() -> str:
+    """
+    Resolve WHISPER_DEVICE to a concrete device.
+
+    'auto' probes CUDA through CTranslate2 (faster-whisper's backend),
+    which is only imported here, so the Groq-only path never pays for it.
+    The result is cached.
+    """
+    if WHISPER_DEVICE != "auto":
+        return WHISPER_DEVICE
+    try:
+        import ctranslate2
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def _frame_rms(data, frame: int):
+    """RMS energy of each whole `frame`-sample frame of (samples, channels) audio."""
+    import numpy as np
+
+    n_frames = len(data) // frame
+    mono = data[:n_frames * frame].mean(axis=1).reshape(n_frames, frame)
+    return np.sqrt(np.mean(mono * mono, axis=1))
+
+
+def _write_temp_wav(data, samplerate: int, like_path: str) -> Optional[str]:
+    """Write audio to a new temp WAV next to like_path; returns its path (None on failure).
+
+    Sharing the recording's directory means the recorder's cleanup also
+    removes anything left behind here.
+    """
+    import soundfile as sf
+
+    fd, path = tempfile.mkstemp(suffix='.wav', dir=os.path.dirname(like_path) or None)
+    os.close(fd)
+    try:
+        sf.write(path, data, samplerate, subtype='PCM_16')
+    except Exception:
+        os.unlink(path)
+        return None
+    return path
+
+
+def trim_silence(audio_path: str) -> Optional[str]:
+    """
+    Strip leading/trailing silence from a WAV, keeping TRIM_PADDING_SECONDS.
+
+    Returns the path of a trimmed temp copy (caller deletes it), or None
+    when the file is kept as is: no speech detected, too little to gain,
+    or the file could not be read.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    try:
+        data, samplerate = sf.read(audio_path, dtype='float32', always_2d=True)
+    except Exception:
+        return None
+    total = len(data)
+    frame = max(1, int(samplerate * TRIM_FRAME_SECONDS))
+    if total < frame:
+        return None
+
+    rms = _frame_rms(data, frame)
+    threshold = max(TRIM_FLOOR, float(rms.max()) * TRIM_RELATIVE)
+    voiced = np.flatnonzero(rms > threshold)
+    if voiced.size == 0:
+        return None
+
+    padding = int(samplerate * TRIM_PADDING_SECONDS)
+    start = max(0, int(voiced[0]) * frame - padding)
+    end = min(total, (int(voiced[-1]) + 1) * frame + padding)
+    if end - start >= total * (1 - TRIM_MIN_SAVING):
+        return None
+    return _write_temp_wav(data[start:end], samplerate, audio_path)
+
+
+def split_at_pauses(audio_path: str) -> List[str]:
+    """
+    Split a WAV longer than GROQ_CHUNK_SECONDS into temp chunk files.
+
+    Each cut is placed at the quietest frame in the last
+    GROQ_SPLIT_WINDOW_SECONDS before the chunk limit, so words are not
+    cut in half. Returns the chunk paths in order (caller deletes them),
+    or an empty list when the audio is short enough to send whole or
+    could not be split.
+    """
+    import numpy as np
+    import soundfile as sf
+
+    try:
+        data, samplerate = sf.read(audio_path, dtype='float32', always_2d=True)
+    except Exception:
+        return []
+    total = len(data)
+    chunk = int(samplerate * GROQ_CHUNK_SECONDS)
+    if total <= chunk:
+        return []
+
+    frame = max(1, int(samplerate * TRIM_FRAME_SECONDS))
+    rms = _frame_rms(data, frame)
+    window = max(1, int(GROQ_SPLIT_WINDOW_SECONDS / TRIM_FRAME_SECONDS))
+    cuts = [0]
+    while total - cuts[-1] > chunk:
+        limit = (cuts[-1] + chunk) // frame
+        lo = max(cuts[-1] // frame + 1, limit - window)
+        cuts.append((lo + int(np.argmin(rms[lo:limit]))) * frame)
+    cuts.append(total)
+
+    paths = []
+    for start, end in zip(cuts, cuts[1:]):
+        path = _write_temp_wav(data[start:end], samplerate, audio_path)
+        if path is None:
+            _remove_files(paths)
+            return []
+        paths.append(path)
+    return paths
+
+
+def encode_flac(audio_path: str) -> Optional[bytes]:
+    """
+    Losslessly re-encode a PCM_16 WAV as FLAC for upload (None on failure).
+
+    Recordings are already 16 kHz mono, so this only removes redundancy;
+    speech FLAC is typically around half the size of the WAV.
+    """
+    import soundfile as sf
+
+    try:
+        data, samplerate = sf.read(audio_path, dtype='int16')
+        buffer = io.BytesIO()
+        sf.write(buffer, data, samplerate, format='FLAC', subtype='PCM_16')
+    except Exception:
+        return None
+    return buffer.getvalue()
+
+
+def _remove_files(paths):
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
 
 
 class TranscriptionService:
     """Handles audio transcription with Groq and Whisper fallback."""
 
-    def __init__(self):
+    def __init__(self, settings=None, status_cb: Optional[Callable[[str, str], None]] = None):
+        """
+        Args:
+            settings: Settings mapping already loaded by the caller
+                (defaults to settings.get_settings())
+            status_cb: Called with (level, message) for progress and errors;
+                level is one of "info", "ok", "warning", "error", "detail".
+                Without it, messages are printed to the console.
+        """
+        self._status_cb = status_cb
         self.whisper_model = None  # Lazy loaded
         self.language = LANGUAGE  # Can be changed at runtime
+        # Live settings view (see settings.get_settings); a caller that has
+        # already loaded it can pass it in
+        self._settings = settings if settings is not None else get_settings()
+        self._client: Optional["httpx.Client"] = None  # Created on first upload
+        self._client_key: Optional[str] = None  # Key in the client's auth header
+        self._cache: Optional[OrderedDict] = None  # Loaded on first transcribe
+
+        # Circuit breaker state for the Groq backend
+        self._groq_failures = 0  # Consecutive failed calls
+        self._groq_trips = 0  # Times the breaker opened since the last success
+        self._groq_skip_until = 0.0  # time.monotonic() deadline
+
+        # With WHISPER_WARMUP the fallback model is loaded in the background,
+        # so a Groq failure doesn't also pay for the model load
+        self._whisper_lock = threading.Lock()
+        if WHISPER_WARMUP and importlib.util.find_spec("faster_whisper") is not None:
+            threading.Thread(target=self._warmup_whisper, daemon=True).start()
+
+    def _status(self, level: str, message: str):
+        if self._status_cb:
+            self._status_cb(level, message)
+        else:
+            console.print(message, style=_STATUS_STYLES.get(level), markup=False)
+
+    def _get_client(self, api_key: str) -> "httpx.Client":
+        """Shared HTTP client; keeps the Groq connection alive between uploads.
+
+        Uses HTTP/2 when the h2 package is installed (httpx[http2]). The
+        Authorization header is set on the client and refreshed only when
+        the configured key changes. httpx itself is imported here, so
+        constructing the service (and starting the app) doesn't load the
+        HTTP stack.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.Client(
+                http2=_http2_available(),
+                timeout=httpx.Timeout(60.0, connect=GROQ_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        if api_key != self._client_key:
+            self._client.headers["Authorization"] = f"Bearer {api_key}"
+            self._client_key = api_key
+        return self._client
+
+    def preload(self):
+        """Import the HTTP stack ahead of the first upload (safe from any thread)."""
+        import httpx  # noqa: F401
+        _http2_available()
+
+    def close(self):
+        """Close the HTTP client and its pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            self._client_key = None
 
     def _get_api_key(self) -> str:
-        """Get Groq API key from settings (priority) or env var fallback."""
-        saved_key = get_settings().get("groq_api_key", "")
+        """Get Groq API key from settings (priority) or env var fallback.
+
+        A dict lookup on the live settings view: no disk access, and keys
+        saved through update_settings are seen immediately.
+        """
+        saved_key = self._settings.get("groq_api_key", "")
         return saved_key if saved_key else GROQ_API_KEY
 
     def transcribe_with_groq(self, audio_path: str) -> str:
         """
         Transcribe audio using Groq API.
 
+        Recordings longer than GROQ_CHUNK_SECONDS are split at pauses and
+        the chunks uploaded concurrently over the shared client; each
+        chunk's text is reported (status "detail") as soon as it and the
+        ones before it are back, and the texts are joined in order. If any
+        chunk fails, the whole call fails.
+
         Args:
             audio_path: Path to WAV audio file
 
         Returns:
             Transcribed text or None if failed
         """
+        import httpx
+
+        chunk_paths = []
         try:
             api_key = self._get_api_key()
             if not api_key:
-                console.print("[yellow]No Groq API key configured[/yellow]")
+                self._status("warning", "No Groq API key configured")
                 return None
+            client = self._get_client(api_key)
 
-            with open(audio_path, 'rb') as audio_file:
-                response = httpx.post(
-                    GROQ_ENDPOINT,
-                    headers={
-                        "Authorization": f"Bearer {api_key}"
-                    },
-                    files={
-                        "file": ("audio.wav", audio_file, "audio/wav")
-                    },
-                    data={
-                        "model": GROQ_MODEL,
-                        "language": self.language,
-                        "response_format": "text"
-                    },
-                    timeout=60.0
-                )
+            chunk_paths = split_at_pauses(audio_path)
+            if not chunk_paths:
+                return self._groq_request(client, audio_path)
 
-                if response.status_code == 200:
-                    return response.text.strip()
-                else:
-                    console.print(
-                        f"[yellow]Groq API error {response.status_code}: "
-                        f"{response.text[:100]}[/yellow]"
-                    )
-                    return None
+            total = len(chunk_paths)
+            self._status("detail", f"Enviando {total} fragmentos en paralelo")
+            # map() yields in chunk order as soon as each prefix is done, so
+            # partial text is shown while later chunks are still in flight
+            texts = []
+            with ThreadPoolExecutor(max_workers=min(GROQ_CHUNK_WORKERS, total)) as pool:
+                results = pool.map(lambda path: self._groq_request(client, path), chunk_paths)
+                for i, text in enumerate(results, 1):
+                    if text is None:
+                        pool.shutdown(cancel_futures=True)
+                        return None
+                    if text:
+                        texts.append(text)
+                        self._status("detail", f"[{i}/{total}] {text}")
+            return " ".join(texts)
 
         except httpx.TimeoutException:
-            console.print("[yellow]Groq API timeout[/yellow]")
+            self._status("warning", "Groq API timeout")
             return None
         except Exception as e:
-            console.print(f"[yellow]Groq error: {e}[/yellow]")
+            self._status("warning", f"Groq error: {e}")
             return None
+        finally:
+            _remove_files(chunk_paths)
+
+    def _groq_request(self, client: "httpx.Client", audio_path: str) -> Optional[str]:
+        """
+        Upload one WAV to Groq; returns its text or None on an API error.
+
+        The audio is sent as FLAC. Uploads are at most GROQ_CHUNK_SECONDS
+        long, so encoding in memory is cheap; if encoding fails, the WAV
+        is streamed from disk as before.
+        """
+        flac = encode_flac(audio_path)
+        data = {
+            "model": GROQ_MODEL,
+            "language": self.language,
+            "response_format": "text"
+        }
+        if flac is not None:
+            response = client.post(
+                GROQ_ENDPOINT,
+                files={"file": ("audio.flac", flac, "audio/flac")},
+                data=data,
+            )
+        else:
+            with open(audio_path, 'rb') as audio_file:
+                response = client.post(
+                    GROQ_ENDPOINT,
+                    files={"file": ("audio.wav", audio_file, "audio/wav")},
+                    data=data,
+                )
+
+        if response.status_code == 200:
+            return response.text.strip()
+        self._status(
+            "warning",
+            f"Groq API error {response.status_code}: {response.text[:100]}"
+        )
+        return None
 
     def transcribe_with_whisper(self, audio_path: str) -> str:
         """
@@ -89,71 +408,196 @@ class TranscriptionService:
             Transcribed text or None if failed
         """
         try:
-            # Lazy load whisper model
-            if self.whisper_model is None:
-                console.print(
-                    f"[cyan]Cargando modelo Whisper '{WHISPER_MODEL}' "
-                    f"(primera vez puede tardar)...[/cyan]"
-                )
-                import whisper
-                self.whisper_model = whisper.load_model(
-                    WHISPER_MODEL,
-                    device=WHISPER_DEVICE
-                )
-                console.print("[green]Modelo Whisper cargado[/green]")
+            model = self._load_whisper()
 
-            result = self.whisper_model.transcribe(
+            # vad_filter skips silent stretches instead of decoding them
+            segments, _ = model.transcribe(
                 audio_path,
                 language=self.language,
-                task="transcribe"
+                task="transcribe",
+                vad_filter=True
             )
 
-            return result["text"].strip()
+            return "".join(segment.text for segment in segments).strip()
 
         except ImportError:
-            console.print(
-                "[red]Whisper no instalado. Instalar con: "
-                "pip install openai-whisper[/red]"
-            )
+            self._status("error", "Whisper no instalado. Instalar con: pip install faster-whisper")
             return None
         except Exception as e:
-            console.print(f"[red]Whisper error: {e}[/red]")
+            self._status("error", f"Whisper error: {e}")
             return None
 
+    def _load_whisper(self, quiet: bool = False):
+        """Load the Whisper model once; waits if a warm-up load is in progress."""
+        with self._whisper_lock:
+            if self.whisper_model is None:
+                if not quiet:
+                    self._status(
+                        "info",
+                        f"Cargando modelo Whisper '{WHISPER_MODEL}' (primera vez puede tardar)..."
+                    )
+                from faster_whisper import WhisperModel
+                device = resolve_whisper_device()
+                self.whisper_model = WhisperModel(
+                    WHISPER_MODEL,
+                    device=device,
+                    compute_type="int8" if device == "cpu" else "float16"
+                )
+                if not quiet:
+                    self._status("ok", "Modelo Whisper cargado")
+            return self.whisper_model
+
+    def _warmup_whisper(self):
+        """Load the model and decode 1 s of silence (background thread).
+
+        The dummy decode runs without the VAD filter, which would otherwise
+        drop the silence before it reached the model. Failures are left for
+        transcribe_with_whisper to report if the fallback is ever needed.
+        """
+        import numpy as np
+
+        try:
+            model = self._load_whisper(quiet=True)
+            segments, _ = model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language=self.language,
+                vad_filter=False
+            )
+            list(segments)
+        except Exception:
+            pass
+
+    def _cache_key(self, audio_path: str) -> str:
+        """Content hash of the audio (plus language) identifying a transcript."""
+        digest = hashlib.blake2b(self.language.encode(), digest_size=16)
+        with open(audio_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_cache(self) -> OrderedDict:
+        if self._cache is None:
+            try:
+                with open(TRANSCRIPT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    self._cache = OrderedDict(json.load(f))
+            except (OSError, ValueError, TypeError):
+                self._cache = OrderedDict()
+        return self._cache
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        cache = self._load_cache()
+        text = cache.get(key)
+        if text is not None:
+            cache.move_to_end(key)
+        return text
+
+    def _cache_put(self, key: str, text: str):
+        cache = self._load_cache()
+        cache[key] = text
+        cache.move_to_end(key)
+        while len(cache) > TRANSCRIPT_CACHE_SIZE:
+            cache.popitem(last=False)
+        # Written to a temp file and renamed over the old one (as in
+        # settings.save_settings), so a crash or a second instance never
+        # leaves a truncated cache. mkstemp creates it owner-only (0600):
+        # transcripts are private
+        cache_dir = os.path.dirname(TRANSCRIPT_CACHE_FILE)
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(list(cache.items()), f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, TRANSCRIPT_CACHE_FILE)
+        except OSError:
+            if tmp_path:
+                _remove_files([tmp_path])
+
     def transcribe(self, audio_path: str) -> str:
         """
         Transcribe audio file using Groq first, fallback to Whisper.
 
+        Groq results are cached by audio content (unless TRANSCRIPT_CACHE
+        is off), so the same recording is never uploaded twice; Whisper
+        fallback results are not cached, so a later retry can still get
+        Groq's. Leading/trailing silence is trimmed before either backend
+        sees the audio.
+
         Args:
             audio_path: Path to audio file
 
         Returns:
             Transcribed text or None if all methods failed
         """
-        # Try Groq first (faster, free)
-        console.print("[cyan]Transcribiendo con Groq...[/cyan]")
-        text = self.transcribe_with_groq(audio_path)
-
-        if text:
-            console.print("[green]Groq OK[/green]")
-            return text
+        cache_key = None
+        if TRANSCRIPT_CACHE:
+            try:
+                cache_key = self._cache_key(audio_path)
+            except OSError:
+                pass
+        if cache_key is not None:
+            text = self._cache_get(cache_key)
+            if text is not None:
+                self._status("ok", "Transcripcion en cache")
+                return text
 
-        # Fallback to local Whisper
-        console.print("[yellow]Groq fallo, intentando Whisper local...[/yellow]")
+        trimmed_path = trim_silence(audio_path)
         try:
-            import whisper  # noqa: F401
-        except ImportError:
-            console.print(
-                "[red]Whisper no esta instalado. Groq fallo y no hay fallback local.[/red]\n"
-                "[yellow]Para instalar Whisper: pip install -r requirements-full.txt[/yellow]"
-            )
-            return None
+            text, from_groq = self._transcribe_uncached(trimmed_path or audio_path)
+        finally:
+            if trimmed_path:
+                _remove_files([trimmed_path])
+        if text and from_groq and cache_key is not None:
+            self._cache_put(cache_key, text)
+        return text
+
+    def _record_groq_result(self, ok: bool):
+        """Update the circuit breaker after a Groq call with an API key set."""
+        if ok:
+            self._groq_failures = 0
+            self._groq_trips = 0
+            return
+        self._groq_failures += 1
+        if self._groq_failures >= GROQ_BREAKER_FAILURES:
+            pause = min(GROQ_BREAKER_SECONDS * 2 ** self._groq_trips, GROQ_BREAKER_MAX_SECONDS)
+            self._groq_skip_until = time.monotonic() + pause
+            self._groq_trips += 1
+            self._groq_failures = 0
+
+    def _transcribe_uncached(self, audio_path: str) -> Tuple[Optional[str], bool]:
+        """Groq first, Whisper as fallback. Returns (text, whether Groq produced it)."""
+        whisper_installed = importlib.util.find_spec("faster_whisper") is not None
+
+        # While the breaker is open, go straight to Whisper (only if there
+        # is a fallback; otherwise Groq is still worth a try)
+        if whisper_installed and time.monotonic() < self._groq_skip_until:
+            self._status("warning", "Groq no disponible recientemente, usando Whisper local...")
+        else:
+            # Try Groq first (faster, free)
+            self._status("info", "Transcribiendo con Groq...")
+            text = self.transcribe_with_groq(audio_path)
+            if self._get_api_key():
+                # An empty string is a successful (silent) transcription
+                self._record_groq_result(text is not None)
+
+            if text:
+                self._status("ok", "Groq OK")
+                return text, True
+
+            # Fallback to local Whisper
+            self._status("warning", "Groq fallo, intentando Whisper local...")
+            if not whisper_installed:
+                self._status("error", "Whisper no esta instalado. Groq fallo y no hay fallback local.")
+                self._status("warning", "Para instalar Whisper: pip install -r requirements-full.txt")
+                return None, False
 
         text = self.transcribe_with_whisper(audio_path)
 
         if text:
-            console.print("[green]Whisper OK[/green]")
-            return text
+            self._status("ok", "Whisper OK")
+            return text, False
 
-        console.print("[red]Todos los metodos de transcripcion fallaron[/red]")
-        return None
+        self._status("error", "Todos los metodos de transcripcion fallaron")
+        return None, False